@@ -1,31 +1,248 @@
 import sys
 import string
+import glob
+import hashlib
+import json
+import mmap
+import os
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
 
-if len(sys.argv) >= 3: # Check if something comes after lines.py TWICE
-    sys.exit("Too many command-line arguments")
+MMAP_MIN_SIZE = 1 << 20  # Files bigger than 1 MiB get mapped instead of read into memory
+SERIAL_MAX_FILES = 64
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".lines_cache.v2.json")  # v2: token based counts
 
-elif len(sys.argv) == 2: # Check if something comes after lines.py ONCE (THIS MAIN FUNCTION)
+
+def count_file(path, known_hash=None):
+    # Returns (counts, content hash); counts is None when the hash says nothing changed
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_MIN_SIZE:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = file.read()
+        try:
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if digest == known_hash:
+                return None, digest
+            lines = iter(data.readline, b"") if isinstance(data, mmap.mmap) else data.splitlines(keepends=True)
+            return count_lines(lines), digest
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+
+COMMENT, DOCSTRING, CODE = 1, 2, 3  # When one line holds several, the highest wins
+SKIPPED = {tokenize.ENCODING, tokenize.ENDMARKER, tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT}
+STRING_START = {getattr(tokenize, name) for name in ("FSTRING_START", "TSTRING_START") if hasattr(tokenize, name)}
+STRING_END = {getattr(tokenize, name) for name in ("FSTRING_END", "TSTRING_END") if hasattr(tokenize, name)}
+
+
+def count_lines(lines):
+    # Classifies by tokens, so quotes inside comments or strings can't throw it off
+    lines = iter(lines)
+    marks = bytearray()  # Per line, what the tokens on it say it is
+    plain = bytearray()  # Per line, a guess from the text alone for anything the tokenizer never reached
+
+    def readline():
+        line = next(lines, b"")
+        if line:
+            marks.append(0)
+            plain.append(guess(line))
+        return line
+
+    def mark(first, last, kind):
+        for row in range(first - 1, min(last, len(marks))):
+            marks[row] = max(marks[row], kind)
+
+    statement = []  # (first row, last row, is a string) for each token of the current statement
+    depth = 0  # Inside an f-string, its pieces all belong to one string
     try:
-        if "." in sys.argv[1]:
-             word, format = sys.argv[1].rsplit(".", 1)  # Split from the right
-             if format == "py": # CHECK IF ITS FORMATTED AS PY
-                try:
-                    count = 0
-                    with open(sys.argv[1]) as filecheck:
-                        for lines in filecheck: # CHECK THE LINE HOW MANY
-                            lines = lines.strip()
-                            if lines and not lines.startswith("#"):
-                                 count += 1
-                    print(count)
-                except FileNotFoundError: # IF NOT FOUND
-                    sys.exit("File does not exist")
-             else:
-                sys.exit("Not a Python file")
+        for token in tokenize.tokenize(readline):
+            if token.type == tokenize.COMMENT:
+                mark(token.start[0], token.start[0], COMMENT)
+            elif token.type == tokenize.NEWLINE:
+                kind = DOCSTRING if all(is_string for _, _, is_string in statement) else CODE
+                for first, last, _ in statement:
+                    mark(first, last, kind)
+                statement = []
+            elif token.type in STRING_START:
+                if not depth:
+                    statement.append([token.start[0], token.end[0], True])
+                depth += 1
+            elif depth:
+                statement[-1][1] = token.end[0]
+                if token.type in STRING_END:
+                    depth -= 1
+            elif token.type not in SKIPPED:
+                statement.append((token.start[0], token.end[0], token.type == tokenize.STRING))
+    except (tokenize.TokenError, SyntaxError):
+        pass  # Not valid Python from here on, the plain guesses cover the rest
+
+    counts = [0, 0, 0, 0]  # blank, comment, docstring, code
+    for row, kind in enumerate(marks):
+        counts[kind or plain[row]] += 1
+    for line in lines:  # Anything the tokenizer stopped before reading
+        counts[guess(line)] += 1
+    blank, comment, docstring, code = counts
+    return code, docstring, comment, blank
+
+
+def guess(line):
+    stripped = line.strip()
+    return 0 if not stripped else COMMENT if stripped.startswith(b"#") else CODE
+
+
+def safe_count(job):
+    path, known_hash = job
+    try:
+        return (path, *count_file(path, known_hash))
+    except OSError:
+        return path, None, None
+
+
+def find_files(target):
+    if os.path.isdir(target):
+        for root, dirs, files in os.walk(target):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+            for name in files:
+                if name.endswith(".py"):
+                    yield os.path.join(root, name)
+    else:
+        for path in glob.iglob(target, recursive=True):
+            if path.endswith(".py") and os.path.isfile(path):
+                yield path
+
+
+def count_files(jobs, workers=None):
+    if len(jobs) <= SERIAL_MAX_FILES:
+        return [safe_count(job) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(safe_count, jobs, chunksize=chunksize))
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    temp = f"{path}.tmp"
+    try:
+        with open(temp, "w") as file:
+            json.dump(cache, file)
+        os.replace(temp, path)
+    except OSError:
+        pass  # Can't write the cache, next scan just does the full work again
+
+
+def scan(target, workers=None, use_cache=True, stats=False, cache_path=CACHE_PATH):
+    paths = sorted(find_files(target))
+    if not paths:
+        sys.exit("No Python files found")
+
+    cache = load_cache(cache_path) if use_cache else {}
+    key = os.path.abspath(target)
+    old = cache.get(key, {})
+    new = {}
+    results = []
+    jobs = []
+    for path in paths:
+        try:
+            info = os.stat(path)
+        except OSError:
+            continue
+        entry = old.get(path)
+        if entry and entry[0] == info.st_size and entry[1] == info.st_mtime_ns:
+            new[path] = entry  # Unchanged on disk, not even opened
+            results.append((path, entry[3]))
         else:
-             print("Not a Python file")
-    except IndexError:
-        sys.exit("Not a python file")
+            jobs.append((path, entry[2] if entry else None))
+            new[path] = [info.st_size, info.st_mtime_ns, None, entry[3] if entry else None]
+
+    rehashed = 0
+    for path, counts, digest in count_files(jobs, workers):
+        if digest is None:
+            del new[path]
+            continue
+        if counts is None:  # Touched but same content, keep the old counts
+            rehashed += 1
+            counts = new[path][3]
+        new[path][2:] = [digest, counts]
+        results.append((path, counts))
+
+    if use_cache:
+        cache[key] = new  # Files that disappeared drop out here
+        save_cache(cache, cache_path)
+
+    totals = {}
+    for path, counts in results:
+        folder = totals.setdefault(os.path.dirname(path) or ".", [0, 0, 0, 0])
+        for i, value in enumerate(counts):
+            folder[i] += value
+    print_totals(totals, len(results))
+    if stats:
+        hits = len(results) - len(jobs) + rehashed
+        print(f"cache: {hits} hits ({rehashed} by content hash), {len(jobs) - rehashed} re-read, {len(results)} files")
+
+
+def print_totals(totals, files):
+    print(f"{'code':>10} {'docstring':>10} {'comment':>10} {'blank':>10}  directory")
+    grand = [0, 0, 0, 0]
+    for folder in sorted(totals):
+        code, docstring, comment, blank = totals[folder]
+        print(f"{code:>10} {docstring:>10} {comment:>10} {blank:>10}  {folder}")
+        for i, value in enumerate(totals[folder]):
+            grand[i] += value
+    print(f"{grand[0]:>10} {grand[1]:>10} {grand[2]:>10} {grand[3]:>10}  TOTAL ({files} files)")
+
+
+def is_tree(target):
+    return os.path.isdir(target) or glob.has_magic(target)
+
+
+def main():
+    options = [arg for arg in sys.argv[1:] if arg in ("--stats", "--no-cache")]
+    targets = [arg for arg in sys.argv[1:] if arg not in options]
+    if options and len(targets) == 1 and is_tree(targets[0]): # Folder scan with --stats / --no-cache
+        scan(targets[0], use_cache="--no-cache" not in options, stats="--stats" in options)
+
+    elif len(sys.argv) >= 3: # Check if something comes after lines.py TWICE
+        sys.exit("Too many command-line arguments")
+
+    elif len(sys.argv) == 2 and is_tree(sys.argv[1]): # A folder or a glob like src/**/*.py
+        scan(sys.argv[1])
+
+    elif len(sys.argv) == 2: # Check if something comes after lines.py ONCE (THIS MAIN FUNCTION)
+        try:
+            if "." in sys.argv[1]:
+                 word, format = sys.argv[1].rsplit(".", 1)  # Split from the right
+                 if format == "py": # CHECK IF ITS FORMATTED AS PY
+                    try:
+                        count = 0
+                        with open(sys.argv[1]) as filecheck:
+                            for lines in filecheck: # CHECK THE LINE HOW MANY
+                                lines = lines.strip()
+                                if lines and not lines.startswith("#"):
+                                     count += 1
+                        print(count)
+                    except FileNotFoundError: # IF NOT FOUND
+                        sys.exit("File does not exist")
+                 else:
+                    sys.exit("Not a Python file")
+            else:
+                 print("Not a Python file")
+        except IndexError:
+            sys.exit("Not a python file")
+
+    elif len(sys.argv) == 1: # Quit when nothing comes after lines.py
+        sys.exit("Too few command-line arguments")
 
-elif len(sys.argv) == 1: # Quit when nothing comes after lines.py
-    sys.exit("Too few command-line arguments")
 
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,149 @@
 import sys
+import argparse
 import csv
-from tabulate import tabulate
+import os
+from itertools import islice
 
-if len(sys.argv) >= 3:
+SAMPLE_ROWS = 1000  # Rows read up front to work out the column widths
+SMALL_FILE = 1 << 20  # Up to 1 MiB without options, tabulate prints it exactly like before
+PAGE_SIZE = 20
+WRITE_EVERY = 256  # Rows per stdout write
+
+
+def is_number(cell):
+    try:
+        float(cell)
+        return True
+    except ValueError:
+        return False
+
+
+def measure(rows, headers):
+    # tabulate's grid keeps at least 2 spaces after a header, so do the same
+    widths = [len(header) + 2 for header in headers]
+    numeric = [True] * len(headers)
+    whole = [0] * len(headers)  # Numbers line up on the decimal point, like tabulate's numalign="decimal"
+    fraction = [0] * len(headers)
+    for row in rows:
+        for i, cell in enumerate(row[:len(headers)]):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+            if not cell:
+                continue  # Empty counts as missing, it doesn't make a number column text
+            if numeric[i] and not is_number(cell):
+                numeric[i] = False
+            head, dot, tail = cell.partition(".")
+            whole[i] = max(whole[i], len(head))
+            fraction[i] = max(fraction[i], len(dot + tail))
+    for i in range(len(headers)):
+        numeric[i] = numeric[i] and whole[i] + fraction[i] > 0  # A column with no values at all stays text
+        if numeric[i]:
+            widths[i] = max(widths[i], whole[i] + fraction[i])
+    return widths, numeric, fraction
+
+
+# Cells are printed as written, tabulate would reformat numbers (12.50 shows as 12.5, 007 as 7)
+def grid_line(widths, fill="-"):
+    return "+" + "+".join(fill * (width + 2) for width in widths) + "+\n"
+
+
+def grid_row(row, widths, numeric, fraction):
+    cells = []
+    for i, width in enumerate(widths):
+        cell = row[i] if i < len(row) else ""
+        if numeric[i] and cell:
+            _, dot, tail = cell.partition(".")
+            cell += " " * (fraction[i] - len(dot + tail))
+        cells.append(cell.rjust(width) if numeric[i] else cell.ljust(width))
+    return "| " + " | ".join(cells) + " |\n"
+
+
+def render(rows, headers, widths, numeric, fraction, out=sys.stdout):
+    line = grid_line(widths)
+    # Headers of number columns go right, like tabulate does
+    out.write(line + grid_row(headers, widths, numeric, [0] * len(headers)) + grid_line(widths, "="))
+    out.flush()  # Header shows up right away
+    buffer = []
+    first = True
+    for row in rows:
+        buffer.append(grid_row(row, widths, numeric, fraction))
+        buffer.append(line)
+        if first or len(buffer) >= WRITE_EVERY * 2:
+            out.write("".join(buffer))
+            out.flush()
+            buffer.clear()
+            first = False
+    if buffer or first:
+        out.write("".join(buffer) if buffer else line)
+    out.flush()
+
+
+def stream_table(path, page=None, limit=None, exact=False):
+    with open(path, "r", newline="") as file:
+        reader = csv.reader(file)
+        headers = list(next(reader))
+
+        if page is not None:
+            limit = limit or PAGE_SIZE
+            for _ in islice(reader, (page - 1) * limit):  # Skip earlier pages without keeping them
+                pass
+        rows = reader if limit is None else islice(reader, limit)
+
+        if exact:
+            with open(path, "r", newline="") as prepass:
+                widths, numeric, fraction = measure(islice(csv.reader(prepass), 1, None), headers)
+        else:
+            sample = list(islice(rows, SAMPLE_ROWS))
+            widths, numeric, fraction = measure(sample, headers)
+            rows = _chain(sample, rows)
+        render(rows, headers, widths, numeric, fraction)
+
+
+def _chain(sample, rest):
+    yield from sample
+    yield from rest
+
+
+def positive(value):
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError("needs a positive number")
+    return int(value)
+
+
+def parse_options(args):
+    parser = argparse.ArgumentParser(prog="pizza.py")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--page", type=positive)
+    parser.add_argument("--limit", type=positive)
+    parser.add_argument("--exact", action="store_true")
+    options = parser.parse_intermixed_args(args)
+    return options.files, options
+
+
+positional, options = parse_options(sys.argv[1:])
+
+if len(positional) >= 2:
     sys.exit("Too many command-line arguments")
 
-elif len(sys.argv) == 2:
+elif len(positional) == 1:
     try:
-        if "." in sys.argv[1]:
-            word, format = sys.argv[1].rsplit(".", 1)
+        if "." in positional[0]:
+            word, format = positional[0].rsplit(".", 1)
             if format == "csv":
                 try:
-                    with open(sys.argv[1], 'r') as file:
-                        reader = csv.reader(file)
-                        table = []
-                        headers = list(next(reader))
-                        for row in reader:
-                            table.append(row)
-                    print(tabulate(table, headers, tablefmt="grid"))
+                    streaming = options.page is not None or options.limit is not None or options.exact
+                    if streaming or os.path.getsize(positional[0]) > SMALL_FILE:
+                        stream_table(positional[0], options.page, options.limit, options.exact)
+                    else:
+                        from tabulate import tabulate  # Only the small-file path needs it, big files start faster without
+
+                        with open(positional[0], 'r') as file:
+                            reader = csv.reader(file)
+                            table = []
+                            headers = list(next(reader))
+                            for row in reader:
+                                table.append(row)
+                        print(tabulate(table, headers, tablefmt="grid"))
                 except FileNotFoundError:
                     sys.exit("File does not exist")
             else:
@@ -27,5 +153,5 @@ elif len(sys.argv) == 2:
     except IndexError:
         sys.exit("Not a CSV file")
 
-elif len(sys.argv) == 1:
+elif len(positional) == 0:
     sys.exit("Too few command-line arguments")
@@ -1,35 +1,174 @@
 import sys
+import argparse
 import csv
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-if len(sys.argv) >= 4:  # Check if something comes after scourgify.py 3 TIMES
-    sys.exit("Too many command-line arguments")
+CHUNK_SIZE = 8 << 20  # Bytes per chunk handed to a worker
+SMALL_FILE = 8 << 20  # Smaller than this, row by row is already quick and needs no workers
+FIELDNAMES = ["first", "last", "house"]
+
+
+def scourgify_rows(input_path, output_path):
+    with open(input_path, "r", newline="") as input_file:
+        reader = csv.DictReader(input_file)  # Read CSV as dictionary
+
+        with open(output_path, "w", newline="") as output_file:
+            writer = csv.DictWriter(output_file, fieldnames=FIELDNAMES)
+            writer.writeheader()
+
+            for row in reader:
+                last, first = row["name"].split(", ")
+                writer.writerow({"first": first, "last": last, "house": row["house"]})
+
+
+# Assumes no quoted field spans several lines, which holds for name/house rosters
+def split_ranges(path, start, chunk_size=CHUNK_SIZE):
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as file:
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()  # Move the cut to the end of the line it landed in
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def transform_chunk(job):
+    path, start, end, name_index, house_index = job
+    with open(path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+    out = io.StringIO()
+    writer = csv.writer(out)
+    rows = []
+    for row in csv.reader(io.StringIO(text, newline="")):
+        if not row:
+            continue
+        last, first = row[name_index].split(", ")
+        rows.append((first, last, row[house_index]))
+    writer.writerows(rows)  # One call for the whole chunk
+    return out.getvalue()
+
+
+def scourgify_chunks(input_path, output_path, workers=None, chunk_size=CHUNK_SIZE):
+    with open(input_path, "r", newline="") as input_file:
+        header = next(csv.reader([input_file.readline()]), [])
+        body_start = input_file.tell()
+    if not header:  # Empty input, just the header like rows mode
+        write_header_only(output_path)
+        return
+    if "name" not in header or "house" not in header:
+        raise KeyError("name and house columns are needed")
+    name_index, house_index = header.index("name"), header.index("house")
+    jobs = [(input_path, start, end, name_index, house_index) for start, end in split_ranges(input_path, body_start, chunk_size)]
+
+    with open(output_path, "w", newline="", buffering=1 << 20) as output_file:
+        csv.writer(output_file).writerow(FIELDNAMES)
+        with ProcessPoolExecutor(workers) as pool:
+            for block in pool.map(transform_chunk, jobs):  # map keeps the input order
+                output_file.write(block)
+
+
+def write_header_only(output_path):
+    with open(output_path, "w", newline="") as output_file:
+        csv.writer(output_file).writerow(FIELDNAMES)
+
+
+def scourgify_pandas(input_path, output_path):
+    if os.path.getsize(input_path) == 0:
+        write_header_only(output_path)
+        return
+    import pandas as pd
 
-elif len(sys.argv) == 3:  # Check if something comes after scourgify.py ONCE (THIS MAIN FUNCTION)
     try:
-        if "." in sys.argv[1]:
-            word, format = sys.argv[1].rsplit(".", 1)  # Split from the right
-            if format == "csv":  # CHECK IF IT'S FORMATTED AS CSV
-                try:
-                    with open(sys.argv[1], "r", newline="") as input_file:
-                        reader = csv.DictReader(input_file)  # Read CSV as dictionary
-
-                        with open(sys.argv[2], "w", newline="") as output_file:
-                            fieldnames = ["first", "last", "house"]
-                            writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-                            writer.writeheader()
-
-                            for row in reader:
-                                last, first = row["name"].split(", ")
-                                writer.writerow({"first": first, "last": last, "house": row["house"]})
-
-                except FileNotFoundError:  # IF NOT FOUND
-                    sys.exit(f"Could not read {sys.argv[1]}")
+        import pyarrow  # noqa: F401
+        engine = "pyarrow"
+    except ImportError:
+        engine = "c"
+    students = pd.read_csv(input_path, dtype=str, engine=engine, keep_default_na=False)
+    names = students["name"].str.split(", ", n=1, expand=True)
+    if names.shape[1] != 2 or names[1].isna().any() or names[1].str.contains(", ", regex=False).any():
+        raise ValueError("Every name must look like 'Last, First'")
+    out = pd.DataFrame({"first": names[1], "last": names[0], "house": students["house"]})
+    out.to_csv(output_path, index=False, lineterminator="\r\n")
+
+
+MODES = {"rows": scourgify_rows, "chunks": scourgify_chunks, "pandas": scourgify_pandas}
+
+
+def benchmark(rows=1_000_000):
+    with tempfile.TemporaryDirectory() as folder:
+        source = os.path.join(folder, "before.csv")
+        with open(source, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["name", "house"])
+            houses = ["Gryffindor", "Hufflepuff", "Ravenclaw", "Slytherin"]
+            writer.writerows((f"Student{i}, Name{i}", houses[i % 4]) for i in range(rows))
+
+        outputs = {}
+        for mode, run in MODES.items():
+            target = os.path.join(folder, f"after_{mode}.csv")
+            start = time.perf_counter()
+            try:
+                run(source, target)
+            except ImportError as error:
+                print(f"{mode:>7}: skipped ({error})")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{mode:>7}: {rows / elapsed:12.0f} rows/sec")
+            with open(target, "rb") as file:
+                outputs[mode] = file.read()
+        if len(set(outputs.values())) > 1:
+            sys.exit("Modes disagree on the output!")
+
+
+def parse_options(args):
+    parser = argparse.ArgumentParser(prog="scourgify.py")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--mode", choices=MODES)
+    parser.add_argument("--bench", nargs="?", const=1_000_000, type=int, metavar="ROWS")
+    options = parser.parse_intermixed_args(args)
+    return options.files, options
+
+
+def main():
+    positional, options = parse_options(sys.argv[1:])
+    if options.bench is not None:
+        benchmark(options.bench)
+        return
+
+    if len(positional) >= 3:  # Check if something comes after scourgify.py 3 TIMES
+        sys.exit("Too many command-line arguments")
+
+    elif len(positional) == 2:  # Check if something comes after scourgify.py ONCE (THIS MAIN FUNCTION)
+        try:
+            if "." in positional[0]:
+                word, format = positional[0].rsplit(".", 1)  # Split from the right
+                if format == "csv":  # CHECK IF IT'S FORMATTED AS CSV
+                    try:
+                        mode = options.mode
+                        if mode is None:
+                            mode = "rows" if os.path.getsize(positional[0]) < SMALL_FILE else "chunks"
+                        MODES[mode](positional[0], positional[1])
+
+                    except (FileNotFoundError, KeyError, ValueError):  # IF NOT FOUND OR NOT A name,house ROSTER
+                        sys.exit(f"Could not read {positional[0]}")
+                else:
+                    sys.exit("Not a CSV file")
             else:
-                sys.exit("Not a CSV file")
-        else:
-            sys.exit("Not a CSV  file")
-    except IndexError:
-        sys.exit("Not a CSV file")
-
-elif len(sys.argv) <= 2:  # Quit when nothing comes after scourgify.py + x [0]
-    sys.exit("Too few command-line arguments")
+                sys.exit("Not a CSV  file")
+        except IndexError:
+            sys.exit("Not a CSV file")
+
+    elif len(positional) <= 1:  # Quit when nothing comes after scourgify.py + x [0]
+        sys.exit("Too few command-line arguments")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,251 @@
 import sys
+import argparse
+import glob
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageOps
 
-if len(sys.argv) >= 4:  # Check if something comes after scourgify.py 3 TIMES
-    sys.exit("Too many command-line arguments")
+SHIRT_PATH = "shirt.png"
+IMAGE_FORMATS = (".jpg", ".jpeg", ".png")
+STAGES = ("decode", "fit", "paste", "encode")
 
-elif len(sys.argv) == 3:  # Check if something comes after scourgify.py ONCE (THIS MAIN FUNCTION)
+
+def load_shirt(path=SHIRT_PATH):
+    shirt = Image.open(path)
+    shirt.load()
+    return shirt, shirt.getchannel("A")
+
+
+def dress(input_path, output_path, shirt, mask):
+    timings = {}
+    start = time.perf_counter()
+    input_image = Image.open(input_path)
+    input_image.load()
+    timings["decode"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # Resize and crop input to match the shirt's size
+    input_image = ImageOps.fit(input_image, shirt.size)
+    timings["fit"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # Overlay the shirt on the input image
+    input_image.paste(shirt, (0, 0), mask)
+    timings["paste"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    input_image.save(output_path)
+    timings["encode"] = time.perf_counter() - start
+    return timings
+
+
+class FastShirt:
+    def __init__(self, shirt, mask):
+        import numpy as np  # Only the fast path needs NumPy
+
+        self.np = np
+        self.shirt, self.mask = shirt, mask  # For photos the fast path doesn't handle
+        self.size = shirt.size
+        alpha = np.asarray(mask, dtype=np.uint16)[..., None]
+        # shirt * alpha never changes, so it's worked out once; +127 rounds the // 255 below
+        self.shirt_part = np.asarray(shirt.convert("RGB"), dtype=np.uint16) * alpha + 127
+        self.keep = 255 - alpha
+        self.work = np.empty(self.shirt_part.shape, dtype=np.uint16)
+        self.out = np.empty(self.shirt_part.shape, dtype=np.uint8)
+
+    def decode(self, input_path):
+        # None for anything that isn't plain RGB (grayscale, CMYK, RGBA...), dress() keeps those modes
+        image = Image.open(input_path)
+        if image.mode != "RGB":
+            return None
+        if image.format == "JPEG":
+            # Ask libjpeg for a 1/2, 1/4 or 1/8 scale decode that is still big enough for the fit
+            width, height = image.size
+            scale = max(self.size[0] / width, self.size[1] / height)
+            image.draft("RGB", (math.ceil(width * scale), math.ceil(height * scale)))
+        image.load()
+        return image
+
+    def composite(self, image):
+        np = self.np
+        np.multiply(np.asarray(image), self.keep, out=self.work)
+        self.work += self.shirt_part
+        self.work //= 255
+        np.copyto(self.out, self.work, casting="unsafe")
+        return Image.fromarray(self.out)
+
+
+def dress_fast(input_path, output_path, fast):
+    timings = {}
+    start = time.perf_counter()
+    input_image = fast.decode(input_path)
+    if input_image is None:
+        return dress(input_path, output_path, fast.shirt, fast.mask)
+    timings["decode"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    input_image = ImageOps.fit(input_image, fast.size)
+    timings["fit"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    output_image = fast.composite(input_image)
+    timings["paste"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    output_image.save(output_path)
+    timings["encode"] = time.perf_counter() - start
+    return timings
+
+
+def difference(first_path, second_path):
+    # Mean and max per-channel difference between two images of the same size
+    import numpy as np
+
+    first = np.asarray(Image.open(first_path).convert("RGB"), dtype=np.int16)
+    second = np.asarray(Image.open(second_path).convert("RGB"), dtype=np.int16)
+    diff = np.abs(first - second)
+    return float(diff.mean()), int(diff.max())
+
+
+_shirt = None  # Each worker process loads the overlay once, in init_worker
+_fast = None
+
+
+def init_worker(shirt_path, fast=False):
+    global _shirt, _fast
+    _shirt = load_shirt(shirt_path)
+    _fast = FastShirt(*_shirt) if fast else None
+
+
+def dress_job(job):
+    input_path, output_path = job
     try:
-        if "." in sys.argv[1] and "." in sys.argv[2]:
-            word1, format1 = sys.argv[1].rsplit(".", 1)  # Split from the right
-            word2, format2 = sys.argv[2].rsplit(".", 1)  # Split from the right
-            if format1 == "jpg" and format2 == "jpg":  # CHECK IF IT'S FORMATTED AS CSV
-                try:
-                    shirt = Image.open("shirt.png")
-                    input_image = Image.open(sys.argv[1])
-
-                    # Resize and crop input to match the shirt's size
-                    input_image = ImageOps.fit(input_image, shirt.size)
-
-                    # Overlay the shirt on the input image
-                    input_image.paste(shirt, shirt)
-
-                    # Save the output , THIS ONE WILL AUTO CREATE 2nd ARG
-                    input_image.save(sys.argv[2])
-                except FileNotFoundError:  # IF NOT FOUND
-                    sys.exit(f"Could not open {sys.argv[1]}")
-            elif format1 == "jpg" and format2 != "jpg":
-                sys.exit("Input and output have different extensions")
-            elif format1 != "jpg" and format2 == "jpg":
-                sys.exit("Input and output have different extensions")
+        if _fast is not None:
+            return input_path, dress_fast(input_path, output_path, _fast), None
+        return input_path, dress(input_path, output_path, *_shirt), None
+    except (OSError, ValueError) as error:
+        return input_path, None, str(error)
+
+
+def find_images(source):
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source, recursive=True)
+    return sorted(path for path in paths if path.lower().endswith(IMAGE_FORMATS) and os.path.isfile(path))
+
+
+def run_batch(source, output_dir, workers=None, verbose=False, shirt_path=SHIRT_PATH, fast=False):
+    images = find_images(source)
+    if not images:
+        sys.exit("No images found")
+    # Outputs keep their path under the input root, so a/img.jpg and b/img.jpg from a ** glob don't collide
+    root = source if os.path.isdir(source) else os.path.commonpath([os.path.dirname(path) or "." for path in images])
+    jobs = [(path, os.path.join(output_dir, os.path.relpath(path, root))) for path in images]
+    for folder in {os.path.dirname(output) for _, output in jobs}:
+        os.makedirs(folder, exist_ok=True)
+
+    totals = {stage: [] for stage in STAGES}
+    failed = 0
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 16))
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(shirt_path, fast)) as pool:
+        for path, timings, error in pool.map(dress_job, jobs, chunksize=chunksize):
+            if error is not None:
+                failed += 1
+                print(f"{path}: {error}", file=sys.stderr)
+                continue
+            for stage in STAGES:
+                totals[stage].append(timings[stage])
+            if verbose:
+                print(path + "".join(f"  {stage} {timings[stage] * 1000:.1f} ms" for stage in STAGES))
+    elapsed = time.perf_counter() - start
+
+    done = len(jobs) - failed
+    print(f"{done} images in {elapsed:.2f} s ({done / elapsed:.1f} images/sec, {workers} workers), {failed} failed")
+    for stage in STAGES:
+        times = sorted(totals[stage])
+        if times:
+            print(f"{stage:>7}: mean {sum(times) / len(times) * 1000:7.2f} ms, p50 {times[len(times) // 2] * 1000:7.2f} ms, p95 {times[int(len(times) * 0.95)] * 1000:7.2f} ms")
+
+
+MAX_MEAN_DIFFERENCE = 3.0  # Out of 255, per channel on average
+
+
+def benchmark(source, shirt_path=SHIRT_PATH):
+    images = find_images(source)
+    if not images:
+        sys.exit("No images found")
+    shirt, mask = load_shirt(shirt_path)
+    fast = FastShirt(shirt, mask)
+    with tempfile.TemporaryDirectory() as folder:
+        slow_total = fast_total = 0
+        worst = 0
+        for number, path in enumerate(images):
+            slow_path = os.path.join(folder, f"slow_{number}_" + os.path.basename(path))
+            fast_path = os.path.join(folder, f"fast_{number}_" + os.path.basename(path))
+            slow_time = sum(dress(path, slow_path, shirt, mask).values())
+            fast_time = sum(dress_fast(path, fast_path, fast).values())
+            mean, biggest = difference(slow_path, fast_path)
+            worst = max(worst, mean)
+            slow_total += slow_time
+            fast_total += fast_time
+            size = "x".join(map(str, Image.open(path).size))
+            print(f"{path} ({size}): {slow_time * 1000:7.1f} ms -> {fast_time * 1000:7.1f} ms, diff mean {mean:.2f} max {biggest}")
+        print(f"average: {slow_total / len(images) * 1000:.1f} ms -> {fast_total / len(images) * 1000:.1f} ms per image ({slow_total / fast_total:.1f}x)")
+        if worst > MAX_MEAN_DIFFERENCE:
+            sys.exit(f"Fast path is off by {worst:.2f} on average, over the {MAX_MEAN_DIFFERENCE} tolerance")
+
+
+def batch_main(args):
+    parser = argparse.ArgumentParser(prog="shirt.py --batch")
+    parser.add_argument("source", metavar="INPUT_DIR_OR_GLOB")
+    parser.add_argument("output_dir", metavar="OUTPUT_DIR")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--fast", action="store_true")
+    options = parser.parse_intermixed_args(args)
+    run_batch(options.source, options.output_dir, options.workers, options.verbose, fast=options.fast)
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--batch":
+        batch_main(sys.argv[2:])
+
+    elif len(sys.argv) == 3 and sys.argv[1] == "--bench":
+        benchmark(sys.argv[2])
+
+    elif len(sys.argv) >= 4:  # Check if something comes after scourgify.py 3 TIMES
+        sys.exit("Too many command-line arguments")
+
+    elif len(sys.argv) == 3:  # Check if something comes after scourgify.py ONCE (THIS MAIN FUNCTION)
+        try:
+            if "." in sys.argv[1] and "." in sys.argv[2]:
+                word1, format1 = sys.argv[1].rsplit(".", 1)  # Split from the right
+                word2, format2 = sys.argv[2].rsplit(".", 1)  # Split from the right
+                if format1 == "jpg" and format2 == "jpg":  # CHECK IF IT'S FORMATTED AS CSV
+                    try:
+                        dress(sys.argv[1], sys.argv[2], *load_shirt())
+                    except FileNotFoundError:  # IF NOT FOUND
+                        sys.exit(f"Could not open {sys.argv[1]}")
+                elif format1 == "jpg" and format2 != "jpg":
+                    sys.exit("Input and output have different extensions")
+                elif format1 != "jpg" and format2 == "jpg":
+                    sys.exit("Input and output have different extensions")
+                else:
+                    sys.exit("Invalid Input")
             else:
                 sys.exit("Invalid Input")
-        else:
+        except IndexError:
             sys.exit("Invalid Input")
-    except IndexError:
-        sys.exit("Invalid Input")
 
-elif len(sys.argv) <= 2:  # Quit when nothing comes after scourgify.py + x [0]
-    sys.exit("Too few command-line arguments")
+    elif len(sys.argv) <= 2:  # Quit when nothing comes after scourgify.py + x [0]
+        sys.exit("Too few command-line arguments")
+
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import pytest
+from lines import count_lines, count_file, scan
+
+def counts(source):
+    # (code, docstring, comment, blank)
+    return count_lines(source.encode().splitlines(keepends=True))
+
+def test_plain():
+    assert counts("x = 1\n\n# note\ny = 2\n") == (2, 0, 1, 1)
+    assert counts("") == (0, 0, 0, 0)
+    assert counts("x = 1") == (1, 0, 0, 0)
+
+def test_docstrings():
+    source = 'def f():\n    """One\n\n    two\n    """\n    return 1\n'
+    assert counts(source) == (2, 4, 0, 0)
+    assert counts('rb"""raw\nbytes"""\nR"""x"""\n') == (0, 3, 0, 0)
+    assert counts('"a" "b"\n') == (0, 1, 0, 0)
+
+def test_strings_in_code_are_code():
+    assert counts('x = """\n\nstill code"""\n') == (3, 0, 0, 0)
+    assert counts('print("""hi""")\n') == (1, 0, 0, 0)
+
+def test_quotes_inside_comments_and_strings():
+    source = 'x = 1  # close with """\n\n# a\ny = 2\n"""doc"""\n# b\nz = 3\n'
+    assert counts(source) == (3, 1, 2, 1)
+    assert counts("s = '\"\"\"'\n# after\n") == (1, 0, 1, 0)
+
+def test_f_strings():
+    source = 'def f():\n    f"""doc\n    {1 + 1}\n    """\n    return f"{f\'{2}\'}"\n'
+    assert counts(source) == (2, 3, 0, 0)
+    assert counts('x = f"""a\n{1}\nb"""\n') == (3, 0, 0, 0)
+
+def test_untokenizable_file():
+    # Unterminated string, the rest falls back to a plain text guess
+    assert counts('x = """\nstill going\n\n# hi\n') == (2, 0, 1, 1)
+    assert counts("def f(:\n    pass\n") == (2, 0, 0, 0)
+
+def test_count_file(tmp_path):
+    path = tmp_path / "a.py"
+    path.write_bytes(b'"""doc"""\r\nx = 1\r\n\r\n# c\r\n')
+    result, digest = count_file(path)
+    assert result == (1, 1, 1, 1)
+    assert count_file(path, digest) == (None, digest)
+
+def test_touched_file_is_a_hash_hit(tmp_path, capsys):
+    folder = tmp_path / "src"
+    folder.mkdir()
+    (folder / "a.py").write_text("x = 1\n")
+    (folder / "b.py").write_text("y = 2\n")
+    cache = str(tmp_path / "cache.json")
+    scan(str(folder), stats=True, cache_path=cache)
+    assert "0 hits (0 by content hash), 2 re-read" in capsys.readouterr().out
+
+    stat = os.stat(folder / "a.py")
+    os.utime(folder / "a.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # Touched, same content
+    scan(str(folder), stats=True, cache_path=cache)
+    assert "2 hits (1 by content hash), 0 re-read" in capsys.readouterr().out
+
+    (folder / "b.py").write_text("y = 2\nz = 3\n")
+    scan(str(folder), stats=True, cache_path=cache)
+    out = capsys.readouterr().out
+    assert "1 hits (0 by content hash), 1 re-read" in out
+    assert "TOTAL (2 files)" in out
@@ -0,0 +1,65 @@
+import pytest
+import numb3rs
+from numb3rs import validate, validate_many
+
+CASES = [
+    "255.255.255.255", "1.2.3.4", "0.0.0.0", "10.0.0.1", "01.02.03.04", "001.1.1.1", "100.200.250.199",
+    "256.1.1.1", "1.2.3", "1.2.3.4.5", "1..2.3", ".1.2.3", "1.2.3.4.", "cat", "", "1.2.3.-4",
+    "1.2.3.4\n", "1.2.3.4\n\n", "\n1.2.3.4", "1.2.3.4 ", "1.2.3.4\r\n",
+    "1.2.3.4\0", "1.2\0.3.4", "255.255.255.2555", "0000001.2.3.4", "1.2.3.4" + "5" * 20,
+]
+
+def test_validate():
+    assert validate("255.255.255.255") == True
+    assert validate("01.02.03.04") == True
+    assert validate("256.1.1.1") == False
+    assert validate("1.2.3") == False
+    assert validate("cat") == False
+
+def test_many_matches_validate():
+    assert validate_many(CASES).tolist() == [validate(case) for case in CASES]
+
+def test_many_trailing_newline():
+    assert validate_many(["1.2.3.4\n", "1.2.3.4\n\n", "255.255.255.255\n"]).tolist() == [True, False, True]
+
+def test_many_embedded_nul():
+    assert validate_many(["1.2.3.4\0", "\0", "1.2\0.3.4", "1.2.3.4"]).tolist() == [False, False, False, True]
+
+def test_many_leading_zeros():
+    assert validate_many(["01.02.03.04", "00.0.0.0", "001.1.1.1", "1.1.1.010"]).tolist() == [True, True, False, False]
+
+def test_many_too_long():
+    assert validate_many(["255.255.255.2555", "0000001.2.3.4", "1.2.3.4" + "5" * 20]).tolist() == [False, False, False]
+
+def test_many_bytes_and_non_strings():
+    assert validate_many([b"1.2.3.4", b"cat", b"1.2.3.\xff", None, 1234]).tolist() == [True, False, False, False, False]
+
+def test_many_file(tmp_path):
+    path = tmp_path / "addresses.txt"
+    path.write_bytes(b"1.2.3.4\r\n256.1.1.1\n10.0.0.1")
+    with open(path, "rb") as file:
+        assert validate_many(file).tolist() == [True, False, True]
+    with open(path, "r", newline="") as file:
+        assert validate_many(file).tolist() == [True, False, True]
+
+def test_many_empty():
+    assert validate_many([]).tolist() == []
+    assert validate_many(iter([]), packed=True)[1].tolist() == []
+
+def test_many_packed():
+    mask, value = validate_many(["1.2.3.4", "255.255.255.255", "0.0.0.0", "10.0.0.1\n", "256.1.1.1"], packed=True)
+    assert mask.tolist() == [True, True, True, True, False]
+    assert value.tolist() == [0x01020304, 0xFFFFFFFF, 0, 0x0A000001, 0]
+
+def test_many_column():
+    pd = pytest.importorskip("pandas")
+    column = pd.Series(["1.2.3.4", "cat", "10.0.0.1"], index=[5, 6, 7], name="ip")
+    mask, value = validate_many(column, packed=True)
+    assert mask.name == "ip"
+    assert mask.index.tolist() == [5, 6, 7]
+    assert mask.tolist() == [True, False, True]
+    assert value.tolist() == [0x01020304, 0, 0x0A000001]
+
+def test_many_in_chunks(monkeypatch):
+    monkeypatch.setattr(numb3rs, "CHUNK", 3)
+    assert validate_many(CASES).tolist() == [validate(case) for case in CASES]
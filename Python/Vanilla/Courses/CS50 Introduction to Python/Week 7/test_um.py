@@ -1,5 +1,6 @@
 import pytest
-from um import count
+import um
+from um import count, count_chunks, count_file
 
 def test_single_um():
     assert count("um") == 1
@@ -25,3 +26,37 @@ def test_um_in_sentence():
     assert count("Hello, um, how are you?") == 1
     assert count("Um, I think, um, we should go.") == 2
     assert count("That's um... interesting.") == 1
+
+def test_um_across_chunks():
+    assert count_chunks(["u", "m"]) == 1
+    assert count_chunks(["Hello, u", "m, how are you?"]) == 1
+    assert count_chunks(["yu", "m um"]) == 1
+    assert count_chunks(["um", "brella"]) == 0
+    assert count_chunks([b"um ", b"u", b"m"]) == 2
+
+def test_um_in_file(tmp_path):
+    path = tmp_path / "transcript.txt"
+    path.write_bytes(b"Um, so um... umbrella UM\n" * 1000)
+    assert count_file(path, chunk_size=7) == 3000
+
+def test_um_in_file_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr(um, "PARALLEL_MIN_SIZE", 0)
+    path = tmp_path / "transcript.txt"
+    path.write_bytes(b"Um, so um... umbrella UM\n" * 1000)
+    assert count_file(path, workers=2, chunk_size=5) == 3000
+
+def test_um_non_ascii_neighbours():
+    text = "éum umé 日本um ÜM um😀 um, Um"
+    encoded = text.encode()
+    assert count_chunks([encoded]) == count(text) == 3
+    # Split inside multi-byte characters too
+    for size in (1, 2, 3, 5):
+        assert count_chunks([encoded[i:i + size] for i in range(0, len(encoded), size)]) == count(text)
+
+def test_um_non_ascii_file_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr(um, "PARALLEL_MIN_SIZE", 0)
+    text = "éum um 日本um, ÜM! umé " * 1000
+    path = tmp_path / "transcript.txt"
+    path.write_text(text, encoding="utf-8")
+    assert count_file(path, chunk_size=7) == count(text)
+    assert count_file(path, workers=3, chunk_size=5) == count(text)
@@ -0,0 +1,54 @@
+import pytest
+from watch import EMBED, parse, iter_embeds, file_embeds, extract
+
+PAGE = (
+    '<p>intro</p><iframe width="560" src="https://www.youtube.com/embed/xvFZjo5PgG0"></iframe>'
+    '<iframe src="http://youtube.com/embed/abc_123"></iframe><a href="https://youtube.com/embed/nope">x</a>'
+    '<iframe src="https://cs50.harvard.edu/python"></iframe>'
+    '<iframe title="é" src="https://youtube.com/embed/xvFZjo5PgG0"></iframe>'
+) * 20
+
+def expected(text):
+    return [(match.start(), match.group(1)) for match in EMBED.finditer(text)]
+
+def test_parse():
+    assert parse('<iframe src="https://youtube.com/embed/xvFZjo5PgG0"></iframe>') == "https://youtu.be/xvFZjo5PgG0"
+    assert parse('<a href="https://youtube.com/embed/xvFZjo5PgG0">') == None
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 50, 64, 1000, len(PAGE)])
+def test_iter_embeds_str_chunks(size):
+    chunks = [PAGE[i:i + size] for i in range(0, len(PAGE), size)]
+    assert list(iter_embeds(chunks)) == expected(PAGE)
+
+@pytest.mark.parametrize("size", [1, 5, 64, 4096])
+def test_iter_embeds_bytes_chunks(size):
+    data = PAGE.encode()
+    chunks = [data[i:i + size] for i in range(0, len(data), size)]
+    # Offsets are in bytes here, the "é" makes them drift from the str offsets after it
+    assert [video for _, video in iter_embeds(chunks)] == [video for _, video in expected(PAGE)]
+    assert [offset for offset, _ in iter_embeds(chunks)] == [match.start() for match in EMBED.finditer(data.decode("latin-1"))]
+
+def test_iter_embeds_unfinished_tag():
+    assert list(iter_embeds(['<iframe src="https://youtube.com/embed/abc"'])) == [(0, "abc")]
+    assert list(iter_embeds([])) == []
+
+def test_file_embeds(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_bytes(PAGE.encode())
+    found, embeds, error = file_embeds(path)
+    assert error is None
+    assert len(embeds) == 60
+
+def test_file_embeds_unreadable(tmp_path, capsys):
+    missing = tmp_path / "gone.html"
+    path, embeds, error = file_embeds(missing)
+    assert (path, embeds) == (missing, [])
+    assert error
+
+    page = tmp_path / "page.html"
+    page.write_text(PAGE)
+    seen = extract([str(page), str(missing)])
+    assert seen == {"xvFZjo5PgG0", "abc_123"}
+    err = capsys.readouterr().err
+    assert f"{missing}:" in err
+    assert "1 failed" in err
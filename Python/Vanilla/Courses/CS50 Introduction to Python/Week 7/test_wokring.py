@@ -1,5 +1,5 @@
 import pytest
-from working import convert
+from working import convert, convert_many
 
 # Test correct conversions
 def test_correct_conversions():
@@ -40,3 +40,17 @@ def test_edge_cases():
     assert convert("12 PM to 1 PM") == "12:00 to 13:00"
     assert convert("11:59 AM to 12:01 PM") == "11:59 to 12:01"
 
+# Test the batch API agrees with convert()
+def test_convert_many():
+    shifts = ["9:00 AM to 5:00 PM", "10 PM to 8 AM", "12 AM to 12 PM"]
+    assert convert_many(shifts) == [convert(shift) for shift in shifts]
+    assert convert_many(["9 AM to 5 PM", "9 AM - 5 PM"], errors="coerce") == ["09:00 to 17:00", None]
+    with pytest.raises(ValueError):
+        convert_many(["9 AM to 5 PM", "13:00 PM to 14:00 AM"])
+
+def test_convert_many_series():
+    pd = pytest.importorskip("pandas")
+    shifts = pd.Series(["9 AM to 5 PM", "9:60 AM to 5 PM", "9 AM to 5 PM"])
+    assert convert_many(shifts, errors="coerce").tolist() == ["09:00 to 17:00", None, "09:00 to 17:00"]
+    with pytest.raises(ValueError):
+        convert_many(shifts)
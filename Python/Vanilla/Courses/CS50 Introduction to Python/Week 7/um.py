@@ -1,13 +1,108 @@
+import codecs
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+PATTERN = re.compile(r"\bum\b", re.IGNORECASE)
+CHUNK_SIZE = 1 << 20  # Read 1 MiB at a time, memory stays flat whatever the file size
+PARALLEL_MIN_SIZE = 64 << 20  # Smaller files aren't worth starting worker processes for
 
 
 def main():
+    if len(sys.argv) > 1:  # um.py transcript.txt ... ("-" reads stdin)
+        for path in sys.argv[1:]:
+            print(count_stream(sys.stdin.buffer) if path == "-" else count_file(path))
+        return
     print(count(input("Text: ")))
 
 
 def count(s):
-    return len(re.findall(r'\bum\b', s, re.IGNORECASE))
+    return sum(1 for _ in PATTERN.finditer(s))  # Counts matches without building a list of them
+
+
+def count_chunks(chunks, context=False, lookahead=b""):
+    # Bytes are decoded as UTF-8 on the way, so \b sees the same characters count() would
+    # context: the first character only tells \b what came before (it belongs to someone else's range)
+    # lookahead: text right after the stream, only there to confirm an "um" at the very end
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    total = 0
+    tail = None
+    pos = 1 if context else 0
+    offset = 0  # Stream offset of buffer[0]
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            chunk = decoder.decode(chunk)
+        buffer = chunk if tail is None else tail + chunk
+        total += sum(1 for _ in PATTERN.finditer(buffer, pos))
+        last = PATTERN.match(buffer, max(len(buffer) - 2, pos))
+        if last and last.end() == len(buffer):
+            total -= 1  # Can't tell yet whether a word boundary follows, the next chunk decides
+        # Carry the last 2 characters (a possible "um") plus 1 before them as \b context
+        next_pos = max(len(buffer) - 2, pos)
+        cut = max(next_pos - 1, 0)
+        tail, pos, offset = buffer[cut:], next_pos - cut, offset + cut
+
+    if tail is not None:  # The real end of the stream counts as a word boundary
+        stop = len(tail)
+        tail += decoder.decode(lookahead, final=True)
+        for match in PATTERN.finditer(tail, pos):
+            if match.start() >= stop:
+                break
+            total += 1
+    return total
+
+
+def read_chunks(file, size=CHUNK_SIZE, limit=None):
+    while limit is None or limit > 0:
+        chunk = file.read(size if limit is None else min(size, limit))
+        if not chunk:
+            return
+        if limit is not None:
+            limit -= len(chunk)
+        yield chunk
+
+
+def count_stream(stream, chunk_size=CHUNK_SIZE):
+    return count_chunks(read_chunks(stream, chunk_size))
+
+
+def char_start(file, position):
+    # Start of the UTF-8 character holding byte position (continuation bytes look like 0b10xxxxxx)
+    back = max(position - 3, 0)
+    file.seek(back)
+    data = file.read(position + 1 - back)
+    for i in range(len(data) - 1, -1, -1):
+        if data[i] & 0xC0 != 0x80:
+            return back + i
+    return position
+
+
+def count_range(path, start, stop, chunk_size=CHUNK_SIZE):
+    # Matches that begin in start..stop-1 (both character starts); reads the character before as context
+    # and a few bytes after to confirm a match that begins right at the edge
+    with open(path, "rb") as file:
+        file.seek(stop)
+        lookahead = file.read(5)  # "m" plus one character of up to 4 bytes
+        base = char_start(file, start - 1) if start > 0 else 0
+        file.seek(base)
+        chunks = read_chunks(file, chunk_size, stop - base)
+        return count_chunks(chunks, context=start > 0, lookahead=lookahead)
+
+
+def count_file(path, workers=None, chunk_size=CHUNK_SIZE):
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    if size < PARALLEL_MIN_SIZE or workers == 1:
+        with open(path, "rb") as file:
+            return count_stream(file, chunk_size)
+
+    piece = max(chunk_size, -(-size // (workers * 4)))  # A few pieces per worker evens out the load
+    with open(path, "rb") as file:
+        starts = sorted({char_start(file, start) for start in range(0, size, piece)})  # Never mid-character
+    stops = starts[1:] + [size]
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(count_range, [path] * len(starts), starts, stops, [chunk_size] * len(starts)))
 
 
 if __name__ == "__main__":
@@ -1,18 +1,105 @@
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Ensure we are matching ONLY inside <iframe> tags (compiled once, str and bytes flavour)
+EMBED = re.compile(r'<iframe[^>]+src="https?://(?:www\.)?youtube\.com/embed/([^"]+)"')
+EMBED_BYTES = re.compile(EMBED.pattern.encode())
+CHUNK_SIZE = 1 << 20  # HTML is read 1 MiB at a time
+MAX_TAG_LENGTH = 1 << 16  # An unfinished tag is carried over to the next chunk, up to this size
+SERIAL_MAX_FILES = 16
+HTML_EXTENSIONS = (".html", ".htm")
 
 def main():
+    if len(sys.argv) > 1:  # watch.py page.html dumps/ ... (every embed in every page)
+        extract(sys.argv[1:])
+        return
     print(parse(input("HTML: ")))
 
 def parse(s):
-    # Ensure we are matching ONLY inside <iframe> tags
-    pattern = r'<iframe[^>]+src="https?://(?:www\.)?youtube\.com/embed/([^"]+)"'
-    match = re.search(pattern, s)
+    match = EMBED.search(s)
 
     if match:
         video_id = match.group(1)
         return f"https://youtu.be/{video_id}"
     return None  # If no valid YouTube iframe is found, return None
 
+def iter_embeds(chunks):
+    tail = None
+    offset = 0  # Stream offset of buffer[0]
+    for chunk in chunks:
+        buffer = chunk if tail is None else tail + chunk
+        pattern, close = (EMBED, ">") if isinstance(buffer, str) else (EMBED_BYTES, b">")
+        # Only scan up to the last ">", a tag after it may still be cut off by the chunk edge
+        cut = buffer.rfind(close) + 1
+        for match in pattern.finditer(buffer, 0, cut):
+            yield offset + match.start(), video_id(match)
+        tail = buffer[max(cut, len(buffer) - MAX_TAG_LENGTH):]
+        offset += len(buffer) - len(tail)
+
+    if tail:
+        pattern = EMBED if isinstance(tail, str) else EMBED_BYTES
+        for match in pattern.finditer(tail):
+            yield offset + match.start(), video_id(match)
+
+def video_id(match):
+    value = match.group(1)
+    return value if isinstance(value, str) else value.decode("utf-8", "replace")
+
+def read_chunks(file, size=CHUNK_SIZE):
+    while chunk := file.read(size):
+        yield chunk
+
+def file_embeds(path):
+    # Byte offsets into the file; a list, so it can come back from a worker process
+    try:
+        with open(path, "rb") as file:
+            return path, list(iter_embeds(read_chunks(file))), None
+    except OSError as error:
+        return path, [], error.strerror or str(error)
+
+def find_pages(targets):
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, files in os.walk(target):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(HTML_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield target
+
+def scan_pages(paths, workers=None):
+    if len(paths) <= SERIAL_MAX_FILES:
+        yield from map(file_embeds, paths)
+        return
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(file_embeds, paths, chunksize=chunksize)
+
+def extract(targets, workers=None, out=sys.stdout):
+    paths = list(find_pages(targets))
+    start = time.perf_counter()
+    seen = set()
+    total = 0
+    failed = 0
+    for path, embeds, error in scan_pages(paths, workers):
+        if error is not None:
+            failed += 1
+            print(f"{path}: {error}", file=sys.stderr)
+            continue
+        for offset, video in embeds:
+            total += 1
+            if video not in seen:  # First sighting only, repeats across the corpus are dropped
+                seen.add(video)
+                out.write(f"{path}:{offset}\thttps://youtu.be/{video}\n")
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed else 0
+    print(f"{len(paths)} pages, {total} embeds, {len(seen)} unique in {elapsed:.2f}s ({rate:.0f} pages/sec), {failed} failed", file=sys.stderr)
+    return seen
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,29 @@
-import re
 import sys
+import time
 
 def main():
-    print(convert(input("Hours: ")))
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+        return
+    try:
+        print(convert(input("Hours: ")))
+    except ValueError:
+        sys.exit("ValueError")
+
+
+# Every valid "H[:MM] AM/PM" token mapped to its 24 hour "HH:MM" form, built once at import (1464 entries)
+def build_table():
+    table = {}
+    for hour in range(1, 13):
+        for meridiem in ("AM", "PM"):
+            # 12 AM is midnight, 12 PM is noon
+            hour24 = hour % 12 + (12 if meridiem == "PM" else 0)
+            table[f"{hour} {meridiem}"] = f"{hour24:02}:00"
+            for minute in range(60):
+                table[f"{hour}:{minute:02} {meridiem}"] = f"{hour24:02}:{minute:02}"
+    return table
+
+TABLE = build_table()
 
 
 def convert(s):
@@ -10,55 +31,82 @@ def convert(s):
     # 9 AM to 5 PM
     # 9:00 AM to 5 PM
     # 9 AM to 5:00 PM
-    pattern = r"^([1-9]|1[1-2])(:[0-5][0-9])? (AM|PM) to ([1-9]|1[1-2])(:[0-5][0-9])? (AM|PM)$"
-    match = re.search(pattern, s)
-    try:
-        if match:
-            hour1 = match.group(1)
-            min1 = match.group(2)
-            AMPM1 = match.group(3)
-            hour2 = match.group(4)
-            min2 = match.group(5)
-            AMPM2 = match.group(6)
-
-            if AMPM1 == "AM":
-                if int(hour1) == 12:
-                    hour1 = 0
-                else:
-                    hour1 = int(hour1)
-            else:
-                if int(hour1) == 12:
-                    hour1 = 12
-                else:
-                    hour1 = int(hour1) + 12
-
-            if AMPM2 == "AM":
-                if int(hour2) == 12:
-                    hour2 = 0
-                else:
-                    hour2 = int(hour2)
-            else:
-                if int(hour2) == 12:
-                    hour2 = 12
-                else:
-                    hour2 = int(hour2) + 12
-
-            if min1 == None:
-                min1 = ":00"
-            else:
-                min1 = min1
-
-            if min2 == None:
-                min2 = ":00"
-            else:
-                min2 = min2
-
-            return f"{hour1:02}{min1} to {hour2:02}{min2}"
+    start, separator, end = s.partition(" to ")
+    start = TABLE.get(start)
+    end = TABLE.get(end)
+    if not separator or start is None or end is None:
+        raise ValueError(f"Invalid hours: {s!r}")
+    return f"{start} to {end}"
+
+
+def convert_many(shifts, errors="raise"):
+    # errors="coerce" gives None (NaN for a Series) for invalid shifts instead of raising
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    if hasattr(shifts, "index") and hasattr(shifts, "str"):  # pandas Series
+        return convert_series(shifts, errors)
 
+    lookup = TABLE.get
+    converted = []
+    for shift in shifts:
+        start, separator, end = shift.partition(" to ")
+        start = lookup(start)
+        end = lookup(end)
+        if not separator or start is None or end is None:
+            if errors == "raise":
+                raise ValueError(f"Invalid hours: {shift!r}")
+            converted.append(None)
         else:
-            raise ValueError
-    except ValueError:
-        sys.exit("ValueError")
+            converted.append(f"{start} to {end}")
+    return converted
+
+
+def convert_series(shifts, errors="raise"):
+    # Shift strings repeat a lot, so each distinct one is converted once and the results are spread back
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(shifts)  # Missing values get code -1
+    converted = convert_many(pd.Index(uniques).astype(str), errors="coerce")
+    values = np.array(converted + [None], dtype=object)[codes]  # -1 picks the trailing None
+    result = pd.Series(values, index=shifts.index, name=shifts.name, dtype=object)
+    if errors == "raise" and result.isna().any():
+        raise ValueError(f"Invalid hours: {shifts[result.isna()].iloc[0]!r}")
+    return result
+
+
+def benchmark(count=1_000_000):
+    import random
+
+    import pandas as pd
+
+    tokens = list(TABLE)
+    shifts = [f"{random.choice(tokens)} to {random.choice(tokens)}" for _ in range(count)]  # Mostly distinct, the worst case
+    series = pd.Series(shifts)
+
+    start = time.perf_counter()
+    expected = [convert(shift) for shift in shifts]
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    many = convert_many(shifts)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    column = convert_many(series)
+    vectorized = time.perf_counter() - start
+
+    roster = pd.Series(random.choices(shifts[:500], k=count))  # Real rosters reuse a few hundred shifts
+    start = time.perf_counter()
+    convert_many(roster)
+    repeated = time.perf_counter() - start
+
+    if many != expected or column.tolist() != expected:
+        sys.exit("convert_many() disagrees with convert()")
+    print(f"convert          : {count / single:12.0f} shifts/sec")
+    print(f"convert_many     : {count / batch:12.0f} shifts/sec ({single / batch:.1f}x)")
+    print(f"convert_many (pd): {count / vectorized:12.0f} shifts/sec ({single / vectorized:.1f}x)")
+    print(f"  500 distinct   : {count / repeated:12.0f} shifts/sec ({single / repeated:.1f}x)")
 
 if __name__ == "__main__":
     main()
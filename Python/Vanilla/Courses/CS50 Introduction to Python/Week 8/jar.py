@@ -1,6 +1,11 @@
 import sys
+import threading
+import time
+import weakref
 
 class Jar:
+    __slots__ = ('_capacity', 'cookies')
+
     def __init__(self, capacity=12):
         if capacity > 0:
             self._capacity = capacity
@@ -32,7 +37,187 @@ class Jar:
     def size(self):
         return self.cookies
 
+
+class _Shard:
+    __slots__ = ('lock', 'cookies', 'reserved')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cookies = 0
+        self.reserved = 0  # Free capacity this thread may fill without asking the jar
+
+
+class _Sentinel:
+    __slots__ = ('__weakref__',)
+
+
+def _retire(jar_ref, shard):
+    jar = jar_ref()
+    if jar is not None:
+        jar._fold(shard)
+
+
+class ConcurrentJar:
+    # Locks are always taken jar lock first, then shard locks in list order, so nothing can deadlock
+    __slots__ = ('_capacity', '_reservation', '_free', '_retired', '_lock', '_local', '_shards', '__weakref__')
+
+    def __init__(self, capacity=12, reservation=64):
+        if capacity > 0:
+            self._capacity = capacity
+        else:
+            raise ValueError
+        self._reservation = reservation  # Extra capacity a thread grabs when its shard runs dry
+        self._free = capacity  # Capacity no shard has reserved yet
+        self._retired = 0  # Cookies left behind by threads that have finished
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+
+    def __str__(self):
+        return f'{"🍪"*self.size}'
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            # Thread-local values are dropped when their thread ends, so this fires then and folds the shard back
+            self._local.sentinel = sentinel = _Sentinel()
+            weakref.finalize(sentinel, _retire, weakref.ref(self), shard)
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def _fold(self, shard):
+        with self._lock:
+            with shard.lock:
+                self._retired += shard.cookies
+                self._free += shard.reserved
+                shard.cookies = shard.reserved = 0
+            self._shards.remove(shard)
+
+    def deposit(self, n):
+        if n < 0:
+            raise ValueError
+        shard = self._shard()
+        with shard.lock:  # Fast path, only this thread's own lock
+            if shard.reserved >= n:
+                shard.reserved -= n
+                shard.cookies += n
+                return
+
+        with self._lock:
+            if self._free < n + shard.reserved:
+                # Not enough unreserved capacity left, take back what other threads are sitting on
+                for other in self._shards:
+                    if other is not shard:
+                        with other.lock:
+                            self._free += other.reserved
+                            other.reserved = 0
+            with shard.lock:
+                if self._free + shard.reserved < n:
+                    raise ValueError
+                grant = min(self._free, n - shard.reserved + self._reservation)
+                self._free -= grant
+                shard.reserved += grant - n
+                shard.cookies += n
+
+    def withdraw(self, n):
+        if n < 0:
+            raise ValueError
+        shard = self._shard()
+        with shard.lock:
+            if shard.cookies >= n:
+                shard.cookies -= n
+                shard.reserved += n  # The freed space stays with this thread for its next deposit
+                return
+
+        with self._lock:
+            # Cookies are spread over the shards, so all of them are held while counting and taking
+            for other in self._shards:
+                other.lock.acquire()
+            try:
+                if self._retired + sum(other.cookies for other in self._shards) < n:
+                    raise ValueError
+                taken = min(self._retired, n)
+                self._retired -= taken
+                self._free += taken
+                n -= taken
+                for other in self._shards:
+                    taken = min(other.cookies, n)
+                    other.cookies -= taken
+                    self._free += taken
+                    n -= taken
+            finally:
+                for other in self._shards:
+                    other.lock.release()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def size(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.lock.acquire()
+            try:
+                return self._retired + sum(shard.cookies for shard in self._shards)
+            finally:
+                for shard in self._shards:
+                    shard.lock.release()
+
+    cookies = size
+
+
+class LockedJar(Jar):
+    # The single global lock version, for comparison
+    __slots__ = ('_lock',)
+
+    def __init__(self, capacity=12):
+        super().__init__(capacity)
+        self._lock = threading.Lock()
+
+    def deposit(self, n):
+        with self._lock:
+            super().deposit(n)
+
+    def withdraw(self, n):
+        with self._lock:
+            super().withdraw(n)
+
+
+def benchmark(ops=200_000, thread_counts=(1, 2, 4, 8)):
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{ops} deposit/withdraw pairs per run, GIL {"enabled" if gil else "disabled"}')
+    for threads in thread_counts:
+        per_thread = ops // threads
+        for label, jar in (('global lock', LockedJar(threads * 8)), ('sharded', ConcurrentJar(threads * 8, reservation=4))):
+            start_line = threading.Barrier(threads + 1)
+
+            def work():
+                start_line.wait()
+                for _ in range(per_thread):
+                    jar.deposit(1)
+                    jar.withdraw(1)
+                jar.deposit(1)  # One cookie left behind per thread, to check nothing got lost
+
+            workers = [threading.Thread(target=work) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            start_line.wait()
+            start = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            status = 'ok' if jar.size == threads else f'LOST UPDATES ({jar.size} != {threads})'
+            print(f'{threads} threads, {label:>11}: {per_thread * threads * 2 / elapsed:12.0f} ops/sec  {status}')
+
 def main():
+    if sys.argv[1:] == ['--bench']:
+        benchmark()
+        return
     j = Jar()
 
     print(j)
@@ -1,8 +1,10 @@
 from datetime import date
-import inflect
+from functools import lru_cache
 import sys
 import re
 
+SCALES = ["", " thousand", " million", " billion", " trillion"]  # One per group of 3 digits
+
 def main():
     inpt=input('Date of Birth: ')
     print(get_min(inpt))
@@ -30,16 +32,8 @@ def get_min(inpt):
     # computes days into minutes
     minutes = no_of_days * 24 * 60
 
-    # converts into words
-    inf = inflect.engine()
-    min_words = inf.number_to_words(minutes)
-
-    # remove 'and' and capitalize
-
-    min_words = min_words.replace(' and','').capitalize()
-
-    # return
-    return min_words + ' minutes'
+    # converts into words (without 'and', capitalized)
+    return phrase(minutes)
 
 
 def convert_and_check(day):
@@ -56,6 +50,76 @@ def convert_and_check(day):
     return day
 
 
+@lru_cache(maxsize=None)
+def get_engine():
+    import inflect  # Slow to import, so only when something actually gets spelled
+
+    return inflect.engine()
+
+
+@lru_cache(maxsize=1000)
+def spell_group(number):
+    # 0-999, e.g. 525 -> "five hundred twenty-five"
+    return get_engine().number_to_words(number).replace(' and', '')
+
+
+def spell(number):
+    # Same words as inflect's number_to_words() with ' and' removed, built from cached groups
+    if number < 0:
+        return 'minus ' + spell(-number)
+    if number >= 1000 ** len(SCALES):
+        return get_engine().number_to_words(number).replace(' and', '')
+
+    groups = []
+    while True:
+        number, group = divmod(number, 1000)
+        groups.append(group)
+        if not number:
+            break
+    words = [spell_group(group) + SCALES[i] for i, group in reversed(list(enumerate(groups))) if group]
+    if not words:
+        return spell_group(0)
+    if len(words) > 1 and groups[0] and groups[0] < 100:
+        # inflect writes "one thousand and one", so no comma before a last group under 100
+        return ', '.join(words[:-1]) + ' ' + words[-1]
+    return ', '.join(words)
+
+
+@lru_cache(maxsize=100_000)
+def phrase(minutes):
+    return spell(minutes).capitalize() + ' minutes'
+
+
+def get_min_many(birthdates, today=None):
+    # Invalid dates raise ValueError for lists, and give None in a pandas column
+    import numpy as np
+
+    series = None
+    if hasattr(birthdates, 'index') and hasattr(birthdates, 'to_numpy'):  # pandas Series
+        import pandas as pd
+
+        series = birthdates
+        days = pd.to_datetime(series, format='%Y-%m-%d', errors='coerce').to_numpy(dtype='datetime64[D]')
+    else:
+        birthdates = list(birthdates)
+        for value in birthdates:  # Same YYYY-MM-DD rule as get_min, numpy alone also takes '2000-01' or 'NaT'
+            if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', str(value)):
+                raise ValueError(f'Invalid date: {value!r}')
+        days = np.array(birthdates, dtype='datetime64[D]')
+
+    today = np.datetime64(today or date.today(), 'D')
+    missing = np.isnat(days)
+    minutes = (today - days[~missing]).astype(np.int64) * 24 * 60
+    # Lots of people share a birthday, so each distinct minute count is spelled once
+    unique, inverse = np.unique(minutes, return_inverse=True)
+    phrases = np.array([phrase(int(value)) for value in unique] + [None], dtype=object)
+    result = np.full(len(days), None, dtype=object)
+    result[~missing] = phrases[inverse]
+
+    if series is not None:
+        return pd.Series(result, index=series.index, name=series.name, dtype=object)
+    return result.tolist()
+
 
 if __name__ == "__main__":
     main()
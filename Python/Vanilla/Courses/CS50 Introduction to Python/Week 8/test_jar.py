@@ -1,4 +1,5 @@
-from jar import Jar
+from jar import Jar, ConcurrentJar
+import threading
 import pytest
 
 
@@ -42,3 +43,71 @@ def test_withdraw():
 
     with pytest.raises(ValueError):
          jar.deposit(8)
+
+
+def test_concurrent_same_as_jar():
+    jar = ConcurrentJar(10, reservation=4)
+    assert str(jar) == ''
+
+    jar.deposit(8)
+    jar.withdraw(2)
+    assert str(jar) == '🍪🍪🍪🍪🍪🍪'
+
+    with pytest.raises(ValueError):
+         jar.deposit(8)
+    with pytest.raises(ValueError):
+         jar.withdraw(7)
+    with pytest.raises(ValueError):
+         ConcurrentJar(0)
+
+
+def test_concurrent_threads():
+    jar = ConcurrentJar(8000, reservation=16)
+
+    def fill():
+        for _ in range(1000):
+            jar.deposit(1)
+
+    threads = [threading.Thread(target=fill) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert jar.size == 8000
+
+    with pytest.raises(ValueError):
+         jar.deposit(1)
+    jar.withdraw(8000)  # Taken from every thread's shard
+    assert jar.size == 0
+
+
+def test_concurrent_reclaims_reservations():
+    jar = ConcurrentJar(10, reservation=8)
+    jar.deposit(1)  # This thread now holds the other 9 as its reservation
+
+    def other():
+        jar.deposit(9)
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    thread.join()
+    assert jar.size == 10
+
+
+def test_concurrent_finished_threads_fold_back():
+    jar = ConcurrentJar(100, reservation=8)
+
+    def visit():
+        jar.deposit(2)
+
+    for _ in range(40):
+        thread = threading.Thread(target=visit)
+        thread.start()
+        thread.join()
+    assert len(jar._shards) == 0  # No shard left behind by a finished thread
+    assert jar.size == 80
+    jar.deposit(20)  # Their unused reservations came back too
+    with pytest.raises(ValueError):
+         jar.deposit(1)
+    jar.withdraw(100)
+    assert jar.size == 0
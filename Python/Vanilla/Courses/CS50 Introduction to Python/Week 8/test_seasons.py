@@ -1,4 +1,4 @@
-from seasons import get_min as f
+from seasons import get_min as f, get_min_many, spell
 import pytest
 
 def test_input():
@@ -15,3 +15,25 @@ def test_format():
     assert f(12-12-12) == 'Invalid date'
     assert f(2012-322-12) == 'Invalid date'
     assert f(323-1-1) == 'Invalid date'"""
+
+def test_spell():
+    assert spell(1001) == 'one thousand one'
+    assert spell(525600) == 'five hundred twenty-five thousand, six hundred'
+    assert spell(1000100) == 'one million, one hundred'
+
+def test_many():
+    assert get_min_many(['2000-01-01', '1999-01-01'], today='2001-01-01') == [
+        'Five hundred twenty-seven thousand forty minutes',
+        'One million, fifty-two thousand, six hundred forty minutes',
+    ]
+    with pytest.raises(ValueError):
+        get_min_many(['2012-13-12'])
+    for bad in ('2000-01', 'NaT', '2000-01-01\n'):
+        with pytest.raises(ValueError):
+            get_min_many(['2000-01-01', bad])
+
+def test_many_column():
+    pd = pytest.importorskip('pandas')
+    column = get_min_many(pd.Series(['2000-01-01', 'bad'], name='dob'), today='2001-01-01')
+    assert column.name == 'dob'
+    assert column.tolist() == ['Five hundred twenty-seven thousand forty minutes', None]
@@ -2,14 +2,95 @@
 import random
 import sys
 import time
-import pygame
 import os
 
-pygame.mixer.init()
-start_sound = pygame.mixer.Sound("audio/startdone.mp3")  
-click_sound = pygame.mixer.Sound("audio/clickdone.mp3")  
-gunshot_sound = pygame.mixer.Sound("audio/shotdone.mp3")
-beep_sound = pygame.mixer.Sound("audio/anxietydone.mp3")  
+AUDIO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "audio")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".roulette_pcm_cache")
+SOUND_FILES = {
+    "start": "startdone.mp3",
+    "click": "clickdone.mp3",
+    "shot": "shotdone.mp3",
+    "beep": "anxietydone.mp3",
+}
+
+
+class Silent:
+    # Stands in for a sound when audio is off, missing or there's no audio device
+    def play(self):
+        pass
+
+    def get_length(self):
+        return 0
+
+
+class SoundBank:
+    def __init__(self, folder=AUDIO_DIR, cache_dir=CACHE_DIR, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get("ROULETTE_SOUND", "1") != "0"  # ROULETTE_SOUND=0 for headless runs and tests
+        self.folder = folder
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.sounds = {}
+
+    def get(self, name):
+        if name not in self.sounds:
+            self.sounds[name] = self.load(SOUND_FILES[name]) if self.enabled else Silent()
+        return self.sounds[name]
+
+    def load(self, filename):
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # No banner in the middle of the game
+        try:
+            import pygame
+        except ImportError:
+            self.enabled = False
+            return Silent()
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            path = self.find(filename)
+            cache_path = self.cache_path(path, pygame.mixer.get_init())
+            try:
+                with open(cache_path, "rb") as file:
+                    return pygame.mixer.Sound(buffer=file.read())  # Decoded on an earlier run, no MP3 decoding
+            except OSError:
+                pass
+            sound = pygame.mixer.Sound(path)
+            self.save(cache_path, sound.get_raw())
+            return sound
+        except pygame.error:
+            self.enabled = False  # No audio device, keep playing without sound
+            return Silent()
+        except FileNotFoundError:
+            return Silent()
+
+    def find(self, filename):
+        path = os.path.join(self.folder, filename)
+        if os.path.exists(path):
+            return path
+        for name in os.listdir(self.folder):  # The files ship as .MP3, which matters off Windows
+            if name.lower() == filename.lower():
+                return os.path.join(self.folder, name)
+        raise FileNotFoundError(path)
+
+    def cache_path(self, path, mixer):
+        # Raw samples depend on the mixer format, and the MP3 may change, so both are in the name
+        frequency, size, channels = mixer
+        info = os.stat(path)
+        key = f"{frequency}_{size}_{channels}_{info.st_size}_{info.st_mtime_ns}"
+        return os.path.join(self.cache_dir, f"{os.path.basename(path)}.{key}.pcm")
+
+    def save(self, cache_path, raw):
+        temp = f"{cache_path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp, "wb") as file:
+                file.write(raw)
+            os.replace(temp, cache_path)
+        except OSError:
+            pass  # Can't write the cache, next run just decodes again
+
+
+sounds = SoundBank()
 
 
 def menu(menu):
@@ -101,7 +182,7 @@ def countdown_to_deletion():
     
     for i in range(10, 0, -1):
         print(f"Shutting down in {i} seconds...", end="\r")  # Print countdown on same line
-        beep_sound.play() 
+        sounds.get("beep").play() 
         time.sleep(1)
         
     os.system("shutdown /s /t 1")
@@ -111,6 +192,7 @@ def countdown_to_deletion():
 def gun_loading():
     print("\nLoading the revolver...")
     time.sleep(1)
+    start_sound = sounds.get("start")
     start_sound.play()
     print("Spinning the chamber...")
     time.sleep(1)
@@ -135,6 +217,7 @@ def startgame(bullet_count):
             if trigger != DEATH:
                 print("You Survived! ")
                 print(gun1())
+                click_sound = sounds.get("click")
                 click_sound.play()  
                 time.sleep(click_sound.get_length())  
                 print(f"Chances left: {len(bullets)}")  
@@ -149,6 +232,7 @@ def startgame(bullet_count):
             else:
                 print("You Died! ")
                 print(gun2())
+                gunshot_sound = sounds.get("shot")
                 gunshot_sound.play()  
                 time.sleep(gunshot_sound.get_length())  
                 
@@ -157,5 +241,5 @@ def startgame(bullet_count):
         else:
             print("Invalid Action!")
     
-main()
-
+if __name__ == "__main__":
+    main()
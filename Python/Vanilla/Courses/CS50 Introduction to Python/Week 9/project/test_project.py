@@ -1,6 +1,9 @@
+import os
 import pytest
 import random
 from unittest.mock import patch
+
+os.environ["ROULETTE_SOUND"] = "0"  # No mixer, no MP3 decoding, no waiting for sounds to finish
 from project import gun1, gun2, menu, startgame
 
 def test_gun1():
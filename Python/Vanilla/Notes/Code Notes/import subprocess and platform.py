@@ -6,3 +6,9 @@ def clear_screen():
         subprocess.run("cls", shell=True)
     else:
         subprocess.run("clear", shell=True)
+
+# Same result without starting a new process every time: ANSI escape codes
+# \033[2J wipes the screen, \033[H moves the cursor back to the top left
+# (see Screen in Method Notes/My Custom Functions/Figlet_Menu.py for a version that only redraws changed lines)
+def clear_screen_ansi():
+    print("\033[2J\033[H", end="", flush=True)
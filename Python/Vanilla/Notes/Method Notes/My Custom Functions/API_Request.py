@@ -1,8 +1,282 @@
-import requests
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from Lazy_Import import lazy_import
+
+asyncio = lazy_import("asyncio")
+requests = lazy_import("requests")  # Real import happens on the first request, not at startup
+
+API_URL = "https://zenquotes.io/api/random"
+API_MIN_INTERVAL = 6.0  # zenquotes allows about 5 requests per 30 seconds
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".quote_cache.db")
 
 # 1. Simple API Request
-def generate_quote():
-    response = requests.get("https://zenquotes.io/api/random", timeout=10)
-    response.raise_for_status()                 
-    data = response.json()[0]                 
-    return data["q"], data["a"]
\ No newline at end of file
+def generate_quote(session=None, url=API_URL, timeout=10):
+    response = (session or requests).get(url, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()[0]
+    return data["q"], data["a"]
+
+# 2. Prefetching Fetcher (Keeps A Buffer Of Quotes Filled In The Background)
+class QuoteFetcher:
+    def __init__(self, url=API_URL, prefetch=2, concurrency=1, timeout=10, retry_delay=1.0, max_retry_delay=60.0,
+                 min_interval=None, cache=None):
+        self.url = url
+        # Seconds between requests across all workers, only the real API needs it by default
+        self.min_interval = min_interval if min_interval is not None else (API_MIN_INTERVAL if url == API_URL else 0.0)
+        self.cache = cache  # Optional ResponseCache, fetched quotes are stored and served when the network lags
+        self.prefetch = prefetch
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.session = requests.Session()  # One keep-alive session shared by every request
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.errors = 0
+        self._failures = 0  # In a row, doubles the back off each time
+        self._next_request = 0.0
+        self._loop = None
+        self._queue = None
+        self._thread = None
+        self._workers = []
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def _run(self, ready):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue(maxsize=self.prefetch)
+        self._workers = [self._loop.create_task(self._fill()) for _ in range(self.concurrency)]
+        ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _wait_turn(self):
+        # Workers take turns, so requests go out at least min_interval apart
+        now = self._loop.time()
+        turn = max(now, self._next_request)
+        self._next_request = turn + self.min_interval
+        await asyncio.sleep(turn - now)
+
+    def _back_off(self):
+        # Upstream is down or rate limiting, every worker waits 1x, 2x, 4x... retry_delay
+        self.errors += 1
+        self._failures += 1
+        delay = min(self.retry_delay * 2 ** (self._failures - 1), self.max_retry_delay)
+        self._next_request = max(self._next_request, self._loop.time() + delay)
+
+    async def _fill(self):
+        while True:
+            await self._wait_turn()
+            try:
+                quote = await asyncio.to_thread(generate_quote, self.session, self.url, self.timeout)
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, self.url, quote)
+            except (requests.RequestException, ValueError, KeyError, IndexError):
+                self._back_off()
+                continue
+            self._failures = 0
+            await self._queue.put(quote)  # Waits here while the buffer is full
+
+    def buffered(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def get(self, timeout=None):
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def get_or_fetch(self, timeout=None):
+        # Straight from the buffer when it has one; on an empty buffer a fresh cached quote comes back at once
+        # (the fill workers are already fetching new ones into the cache), otherwise wait, then go stale or direct
+        self.start()
+        if self.cache is not None and not self.buffered():
+            quote, _ = self.cache.get(self.url)
+            if quote is not None:
+                return quote
+        try:
+            return self.get(timeout=timeout if timeout is not None else self.timeout)
+        except TimeoutError:
+            if self.cache is not None:
+                quote, _ = self.cache.get(self.url, allow_stale=True)
+                if quote is not None:
+                    return quote
+            return generate_quote(self.session, self.url, self.timeout)
+
+    async def _cancel_workers(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._cancel_workers(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self.session.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+# 3. Local Stub Server (Fake zenquotes API For Offline Latency/Throughput Tests)
+def start_stub_server(latency=0.05, port=0):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    count = [0]
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+        def do_GET(self):
+            time.sleep(latency)  # Pretend to be a slow upstream
+            count[0] += 1
+            body = json.dumps([{"q": f"Stub quote {count[0]}", "a": "Stub Server"}]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/random"
+
+# 4. Response Cache On Disk (TTL Expiry, LRU Size Bound, Stale-While-Revalidate)
+class ResponseCache:
+    def __init__(self, path=CACHE_PATH, ttl=300, max_entries=500):
+        self.path = path
+        self.ttl = ttl  # Seconds a cached response counts as fresh
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                endpoint TEXT NOT NULL,
+                body TEXT NOT NULL,
+                stored REAL NOT NULL,
+                used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint, used)")
+        self._conn.commit()
+
+    def put(self, endpoint, value):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO responses (endpoint, body, stored, used) VALUES (?, ?, ?, ?)",
+                (endpoint, json.dumps(value), now, now),
+            )
+            # Over the size bound, drop the least recently used rows
+            self._conn.execute(
+                "DELETE FROM responses WHERE id IN (SELECT id FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def get(self, endpoint, allow_stale=False):
+        # Returns (value, is_fresh), or (None, False) when nothing usable is cached
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, body, stored FROM responses WHERE endpoint = ? AND stored >= ? ORDER BY used LIMIT 1",
+                (endpoint, now - self.ttl),
+            ).fetchone()
+            fresh = row is not None
+            if row is None and allow_stale:
+                row = self._conn.execute(
+                    "SELECT id, body, stored FROM responses WHERE endpoint = ? ORDER BY used LIMIT 1",
+                    (endpoint,),
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, False
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            # Least recently used first, so repeat hits rotate through the cached quotes
+            self._conn.execute("UPDATE responses SET used = ? WHERE id = ?", (now, row[0]))
+            self._conn.commit()
+        return tuple(json.loads(row[1])), fresh
+
+    def revalidate(self, endpoint, fetch):
+        with self._lock:
+            if endpoint in self._refreshing:
+                return
+            self._refreshing.add(endpoint)
+
+        def refresh():
+            try:
+                self.put(endpoint, fetch())
+            except (requests.RequestException, ValueError, KeyError, IndexError):
+                pass  # Offline or rate limited, the cached quotes keep being served
+            finally:
+                with self._lock:
+                    self._refreshing.discard(endpoint)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+def cached_quote(cache, url=API_URL, offline=False, session=None, timeout=10):
+    # A fresh cached quote comes back at once (least recently shown first) while a new one is fetched behind it;
+    # once nothing is fresher than the TTL the network goes first and older quotes are only the fallback
+    def fetch():
+        return generate_quote(session, url, timeout)
+
+    if offline:
+        quote, _ = cache.get(url, allow_stale=True)
+        if quote is None:
+            raise LookupError("Offline and no cached quote available")
+        return quote
+
+    quote, _ = cache.get(url)
+    if quote is not None:
+        cache.revalidate(url, fetch)
+        return quote
+    try:
+        quote = fetch()
+    except (requests.RequestException, ValueError, KeyError, IndexError):
+        quote, _ = cache.get(url, allow_stale=True)
+        if quote is None:
+            raise
+        return quote
+    cache.put(url, quote)
+    return quote
@@ -1,6 +1,10 @@
 import sys
 import time
 
+from Lazy_Import import lazy_import
+
+asyncio = lazy_import("asyncio")  # Only loaded once an async animation actually runs
+
 # 1. Animation Text
 def type_text(text, delay_ms=30):
     for char in text:
@@ -22,4 +26,82 @@ def dot_generate(word):
 end='' prevents newlines.
 
 flush=True forces Python to update the terminal immediately.
-"""
\ No newline at end of file
+"""
+
+# 3. Animation Scheduler (Animations Are asyncio Tasks, One stdout Write Per Frame)
+class AnimationScheduler:
+    def __init__(self, fps=30, stream=None):
+        self.fps = fps
+        self.stream = stream or sys.stdout
+        self.frames = 0
+        self._pending = []
+        self._waiters = []
+        self._active = 0
+        self._ticker = None
+
+    def write(self, text):
+        self._pending.append(text)
+
+    async def next_frame(self):
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        await future
+
+    async def _tick(self):
+        interval = 1 / self.fps
+        while self._active or self._pending:
+            await asyncio.sleep(interval)
+            if self._pending:
+                self.stream.write("".join(self._pending))
+                self.stream.flush()
+                self._pending.clear()
+                self.frames += 1
+            waiters, self._waiters = self._waiters, []
+            for future in waiters:
+                if not future.done():
+                    future.set_result(None)
+        self._ticker = None
+
+    def play(self, animation):
+        # Schedules a coroutine; the caller's other tasks keep running while it plays
+        self._active += 1
+        if self._ticker is None:
+            self._ticker = asyncio.ensure_future(self._tick())
+
+        async def run():
+            try:
+                await animation
+            finally:
+                self._active -= 1
+        return asyncio.ensure_future(run())
+
+    async def type_text(self, text, delay_ms=30):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        shown = 0
+        while shown < len(text):
+            # However many characters are due by now go out together in the next frame
+            due = min(len(text), int((loop.time() - start) * 1000 / delay_ms) + 1)
+            self.write(text[shown:due])
+            shown = due
+            await self.next_frame()
+
+    async def dot_generate(self, word, steps=4, delay=0.5):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        last = -1
+        while True:
+            step = int((loop.time() - start) / delay)
+            if step >= steps + 1:
+                return
+            if step < steps and step != last:
+                self.write(f"\r{word}{'.' * step}")
+                last = step
+            await self.next_frame()
+
+def play_animations(*animations, fps=30):
+    # For plain (non-async) callers: run the given animation coroutines to the end
+    async def main():
+        scheduler = AnimationScheduler(fps)
+        await asyncio.gather(*(scheduler.play(animation(scheduler)) for animation in animations))
+    asyncio.run(main())
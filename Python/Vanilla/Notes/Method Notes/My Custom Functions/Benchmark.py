@@ -0,0 +1,279 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import API_Request
+import Animations
+import Database
+import Figlet_Menu
+import Lazy_Import
+
+# 1. Timer Helper
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return time.perf_counter() - start
+
+# 2. Connection Pool vs Fresh Connection Per Query
+def bench_pool(queries=2000, pool_size=5, connect_latency=0.001):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "quotes.db")
+        Database.create_sqlite_database_and_table(path, pool_size, connect_latency)
+        Database.execute("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", ("Hi", "Me"))
+
+        def fresh():
+            conn = Database.sqlite_connector(path, connect_latency)()
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM quotes")
+            cursor.fetchall()
+            cursor.close()
+            conn.close()
+
+        def pooled():
+            Database.fetch_all("SELECT * FROM quotes")
+
+        fresh_time = timed(fresh, queries)
+        pooled_time = timed(pooled, queries)
+        print(f"fresh connect : {queries / fresh_time:10.0f} queries/sec")
+        print(f"pooled        : {queries / pooled_time:10.0f} queries/sec")
+        print(f"connections opened by pool: {Database.get_pool().created}")
+        Database.get_pool().close_all()
+
+# 3. Query Registry vs Re-Reading The .sql File Every Call
+def bench_queries(calls=5000):
+    def reload_every_time():
+        Database.load_queries(Database.DEFAULT_QUERIES)["save_quote"]
+
+    registry = Database.initiate_query_runner()
+
+    def cached():
+        registry["save_quote"]
+
+    reload_time = timed(reload_every_time, calls)
+    cached_time = timed(cached, calls)
+    print(f"load_queries each call : {calls / reload_time:10.0f} lookups/sec")
+    print(f"QueryRegistry          : {calls / cached_time:10.0f} lookups/sec")
+    print(f"file parses by registry: {registry.loads}")
+
+# 4. Batched Inserts (rows/sec For Different Batch Sizes)
+def bench_batch(rows=20000, batch_sizes=(1, 100, 10000)):
+    with tempfile.TemporaryDirectory() as folder:
+        for batch_size in batch_sizes:
+            path = os.path.join(folder, f"batch_{batch_size}.db")
+            Database.create_sqlite_database_and_table(path)
+            data = [(f"Quote number {i}", "Benchmark") for i in range(rows)]
+            start = time.perf_counter()
+            with Database.quote_writer(batch_size, flush_interval=None) as writer:
+                writer.add_many(data)
+            elapsed = time.perf_counter() - start
+            print(f"batch size {batch_size:>6}: {rows / elapsed:10.0f} rows/sec")
+            Database.get_pool().close_all()
+
+# 5. Streaming Rows vs fetchall (Peak Memory)
+def bench_stream(rows=200000):
+    with tempfile.TemporaryDirectory() as folder:
+        Database.create_sqlite_database_and_table(os.path.join(folder, "stream.db"))
+        with Database.quote_writer(10000, flush_interval=None) as writer:
+            writer.add_many((f"Quote number {i}", "Benchmark") for i in range(rows))
+
+        for label, read in (
+            ("fetchall  ", lambda: sum(1 for _ in Database.fetch_all("SELECT * FROM quotes"))),
+            ("iter_rows ", lambda: sum(1 for _ in Database.iter_saved_quotes())),
+        ):
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = read()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label}: {count} rows, {count / elapsed:10.0f} rows/sec, peak {peak / 1024 / 1024:7.1f} MiB")
+        Database.get_pool().close_all()
+
+# 6. Prefetching Fetcher vs Blocking generate_quote (Against The Local Stub Server)
+def bench_fetch(quotes=50, latency=0.05, prefetch=10, concurrency=4):
+    server, url = API_Request.start_stub_server(latency)
+
+    def percentiles(waits):
+        waits = sorted(waits)
+        return waits[len(waits) // 2] * 1000, waits[int(len(waits) * 0.99)] * 1000
+
+    waits = []
+    start = time.perf_counter()
+    for _ in range(quotes):
+        began = time.perf_counter()
+        API_Request.generate_quote(url=url)
+        waits.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    p50, p99 = percentiles(waits)
+    print(f"generate_quote : {quotes / elapsed:8.1f} quotes/sec, p50 {p50:7.2f} ms, p99 {p99:7.2f} ms")
+
+    with API_Request.QuoteFetcher(url, prefetch, concurrency) as fetcher:
+        while fetcher.buffered() < prefetch:  # Let the buffer fill like it would behind the menu
+            time.sleep(0.01)
+        waits = []
+        start = time.perf_counter()
+        for _ in range(quotes):
+            began = time.perf_counter()
+            fetcher.get()
+            waits.append(time.perf_counter() - began)
+        elapsed = time.perf_counter() - start
+    p50, p99 = percentiles(waits)
+    print(f"QuoteFetcher   : {quotes / elapsed:8.1f} quotes/sec, p50 {p50:7.2f} ms, p99 {p99:7.2f} ms")
+    server.shutdown()
+
+# 7. Response Cache vs Network (p50 Latency Against The Local Stub Server, Then With It Down)
+def bench_cache(quotes=200, latency=0.05):
+    server, url = API_Request.start_stub_server(latency)
+    with tempfile.TemporaryDirectory() as folder:
+        cache = API_Request.ResponseCache(os.path.join(folder, "cache.db"), ttl=300)
+
+        def run(label, fetch, calls):
+            waits, seen = [], set()
+            for _ in range(calls):
+                began = time.perf_counter()
+                seen.add(fetch())
+                waits.append(time.perf_counter() - began)
+                time.sleep(0.005)  # Someone reading the quote, the background refresh gets a moment
+            waits.sort()
+            print(f"{label}: p50 {waits[len(waits) // 2] * 1000:8.3f} ms, {len(seen)} different quotes over {calls} calls")
+
+        run("network     ", lambda: API_Request.generate_quote(url=url), 20)
+        run("disk cache  ", lambda: API_Request.cached_quote(cache, url), quotes)
+        server.shutdown()
+        server.server_close()
+        run("cache, down ", lambda: API_Request.cached_quote(cache, url), 20)
+        print(f"hits {cache.hits}, stale {cache.stale_hits}, misses {cache.misses}")
+        cache.close()
+
+# 8. Banner Rendering (New Figlet Every Call vs Render Cache)
+def bench_banner(redraws=200):
+    from pyfiglet import Figlet
+
+    def uncached():
+        Figlet(font="slant").renderText("InspoQGen")
+
+    Figlet_Menu.menu()  # Warm the cache, the first call pays for the font parse
+    uncached_time = timed(uncached, 20) / 20
+    cached_time = timed(Figlet_Menu.menu, redraws) / redraws
+    print(f"Figlet per call : {uncached_time * 1e6:10.1f} us per banner")
+    print(f"render cache    : {cached_time * 1e6:10.1f} us per menu()")
+
+# 9. Menu Redraw (Spawning clear vs Screen Manager)
+def bench_redraw(redraws=50):
+    with open(os.devnull, "w") as devnull:
+        def spawn():
+            subprocess.run("clear", shell=True, stdout=devnull, stderr=devnull)
+            devnull.write(Figlet_Menu.menu())
+
+        screen = Figlet_Menu.Screen(devnull)
+        frames = [Figlet_Menu.menu(), Figlet_Menu.menu().replace("Welcome User!", "Welcome Back!")]
+
+        def repaint():
+            screen.show(frames[repaint.count % 2])
+            repaint.count += 1
+        repaint.count = 0
+
+        spawn_time = timed(spawn, redraws) / redraws
+        repaint_time = timed(repaint, redraws) / redraws
+    print(f"subprocess clear : {spawn_time * 1e6:10.1f} us per redraw")
+    print(f"Screen.show      : {repaint_time * 1e6:10.1f} us per redraw")
+
+# 10. Animations (Blocking type_text vs Scheduler With Other Work Running Alongside)
+def bench_animation(text="The quick brown fox jumps over the lazy dog. " * 6, delay_ms=2):
+    import asyncio
+    from contextlib import redirect_stdout
+
+    class CountingStream:
+        def __init__(self, stream):
+            self.stream = stream
+            self.writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            self.stream.write(data)
+
+        def flush(self):
+            self.stream.flush()
+
+    with open(os.devnull, "w") as devnull:
+        stream = CountingStream(devnull)
+        start = time.perf_counter()
+        with redirect_stdout(stream):
+            Animations.type_text(text, delay_ms)
+        blocking = time.perf_counter() - start
+        print(f"type_text          : {blocking:6.2f} s, {stream.writes} writes, nothing else can run")
+
+        async def main():
+            scheduler = Animations.AnimationScheduler(30, CountingStream(devnull))
+            ticks = 0
+
+            async def other_work():
+                nonlocal ticks
+                while not animation.done():
+                    await asyncio.sleep(0.001)  # Stands in for a fetch or a DB write
+                    ticks += 1
+
+            start = time.perf_counter()
+            animation = scheduler.play(scheduler.type_text(text, delay_ms))
+            await asyncio.gather(animation, other_work())
+            elapsed = time.perf_counter() - start
+            print(f"AnimationScheduler : {elapsed:6.2f} s, {scheduler.stream.writes} writes, {ticks} other steps ran meanwhile")
+
+        asyncio.run(main())
+
+# 11. Cold Start To First Menu Render (Fails When It Goes Over Budget)
+STARTUP_CODE = "import Database, API_Request, Animations, Figlet_Menu; Figlet_Menu.menu()"
+STARTUP_BUDGET_MS = 100  # On top of a bare interpreter start; was ~250 ms before the lazy imports
+
+def cold_start(code, runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    waits = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+        waits.append(time.perf_counter() - start)
+    return sorted(waits)[len(waits) // 2] * 1000
+
+def bench_startup(runs=7, budget_ms=STARTUP_BUDGET_MS):
+    cold_start(STARTUP_CODE, 1)  # First run writes the banner cache, like a user's first launch
+    bare = cold_start("pass", runs)
+    menu = cold_start(STARTUP_CODE, runs)
+    print(f"bare interpreter : {bare:8.1f} ms")
+    print(f"first menu render: {menu:8.1f} ms (+{menu - bare:.1f} ms, budget +{budget_ms} ms)")
+    if menu - bare > budget_ms:
+        sys.exit(f"Startup regression: +{menu - bare:.1f} ms is over the +{budget_ms} ms budget")
+
+def bench_imports(top=15):
+    here = os.path.dirname(os.path.abspath(__file__))
+    Lazy_Import.import_report(STARTUP_CODE, top, cwd=here)
+
+
+BENCHMARKS = {
+    "pool": bench_pool,
+    "queries": bench_queries,
+    "batch": bench_batch,
+    "stream": bench_stream,
+    "fetch": bench_fetch,
+    "cache": bench_cache,
+    "banner": bench_banner,
+    "redraw": bench_redraw,
+    "animation": bench_animation,
+    "startup": bench_startup,
+    "imports": bench_imports,
+}
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            sys.exit(f"Unknown benchmark: {name} (choose from {', '.join(BENCHMARKS)})")
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,30 @@
 import time
-import mysql.connector
+import os
+import re
+import sqlite3
 import sys
+import threading
+import weakref
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+
+# 1. Create DB After Connected (Then Every Query Goes Through The Pool)
+def create_database_and_table(hostInput, userInput, passwordInput, pool_size=5):
+        import mysql.connector
 
-# 1. Create DB After Connected
-def create_database_and_table(hostInput, userInput, passwordInput):
         try:
-            conn = mysql.connector.connect(
-                host=hostInput,
-                user=userInput,
-                password=passwordInput
-            )
+            conn = mysql_connector(hostInput, userInput, passwordInput)()
             cursor = conn.cursor()
             cursor.execute("CREATE DATABASE IF NOT EXISTS QuotesGen")
             cursor.execute("USE QuotesGen")
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS Quotes (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    quotes VARCHAR(255) NOT NULL,
-                    author VARCHAR(255) NOT NULL
-                )
-            """)
+            cursor.execute(CREATE_QUOTES_TABLE)
             conn.commit()
             cursor.close()
             conn.close()
 
+            init_pool(mysql_connector(hostInput, userInput, passwordInput, "QuotesGen"), size=pool_size)
+
             print("\nConnected Succesfully!")
             time.sleep(1)
             for i in range(4):
@@ -52,18 +53,405 @@ def authentication():
     passwordInput = input("Password (default: empty): ").strip() or ""
     return hostInput, userInput, passwordInput
 
-# 3. Load Query 
+# 3. Load Query
+def parse_queries(content):
+    queries = {}
+    for each in content.split("-- name:")[1:]:  # [0] is whatever comes before the first name
+        if each.strip():
+            name, sql = each.strip().split("\n", 1)
+            queries[name.strip()] = sql.strip()
+    return queries
+
 def load_queries(file_path):
     with open(file_path, "r") as file:
-        content = file.read().split("-- name:")
-        queries = {}
-        for each in content:
-            if each.strip(): 
-                name, sql = each.strip().split("\n", 1) 
-                queries[name.strip()] = sql.strip()
-        return queries
-    
-# 4. Instance for Above
-def initiate_query_runner():
-    queries = load_queries(r"D:\College\Programming Files\Codes\Projects\Github Projects\Learning Projects\Beginner\Quote Generator API + DB\queries.sql")
-    return queries
+        return parse_queries(file.read())
+
+# 4. Instance for Above (One Registry Per File, So Repeat Calls Skip The Re-Read)
+DEFAULT_QUERIES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Database.sql")
+_registries = {}
+
+def initiate_query_runner(file_path=DEFAULT_QUERIES):
+    file_path = os.path.abspath(file_path)
+    if file_path not in _registries:
+        _registries[file_path] = QueryRegistry(file_path)
+    return _registries[file_path]
+
+# 5. Table Schema (Shared By MySQL And The SQLite Stand-In)
+CREATE_QUOTES_TABLE = """
+    CREATE TABLE IF NOT EXISTS Quotes (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        quotes VARCHAR(255) NOT NULL,
+        author VARCHAR(255) NOT NULL
+    )
+"""
+
+# 6. Connection Factories (The Pool Calls These When It Needs A New Connection)
+def mysql_connector(hostInput, userInput, passwordInput, database=None):
+    def connect():
+        options = {"host": hostInput, "user": userInput, "password": passwordInput}
+        if database:
+            options["database"] = database
+        import mysql.connector  # Only here, so the SQLite stand-in works without mysql-connector installed
+
+        return mysql.connector.connect(**options)
+    return connect
+
+def sqlite_connector(path, connect_latency=0.0):
+    def connect():
+        return SQLiteConnection(path, connect_latency)
+    return connect
+
+# 7. SQLite Stand-In (Same Calls As mysql.connector, So No MySQL Server Is Needed)
+@lru_cache(maxsize=256)
+def to_sqlite(sql):
+    stripped = sql.strip()
+    if stripped.upper().startswith(("CREATE DATABASE", "USE ")):
+        return None  # SQLite has one database per file, nothing to create or switch
+    sql = sql.replace("INT AUTO_INCREMENT PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+    return sql.replace("%s", "?")
+
+class SQLiteCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, params=()):
+        sql = to_sqlite(sql)
+        if sql is not None:
+            self._cursor.execute(sql, params)
+
+    def executemany(self, sql, rows):
+        self._cursor.executemany(to_sqlite(sql), rows)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size=1):
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def close(self):
+        self._cursor.close()
+
+class SQLiteConnection:
+    def __init__(self, path, connect_latency=0.0):
+        time.sleep(connect_latency)  # Pretend to do the TCP handshake + auth of a real server
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+    def cursor(self, prepared=False):
+        # sqlite3 already keeps a per-connection statement cache, so prepared needs no extra work
+        return SQLiteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def is_connected(self):
+        try:
+            self._conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        self._conn.close()
+
+# 8. Connection Pool
+class ConnectionPool:
+    def __init__(self, connect, size=5, max_idle=300):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._connect = connect
+        self.size = size
+        self.max_idle = max_idle  # Seconds a connection may sit unused before it gets closed
+        self._idle = []  # (connection, last used time), newest at the end
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def get(self, timeout=None):
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No free connection in the pool")
+        try:
+            self.reap()
+            while True:
+                with self._lock:
+                    conn = self._idle.pop()[0] if self._idle else None
+                if conn is None:
+                    conn = self._connect()
+                    self.created += 1
+                    return conn
+                if healthy(conn):  # Health check on checkout, broken ones get replaced
+                    return conn
+                close_quietly(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def put(self, conn):
+        # End whatever transaction is still open (a plain SELECT starts one on MySQL), otherwise the
+        # next borrower keeps reading an old REPEATABLE READ snapshot and misses newer commits
+        if not rollback_quietly(conn):
+            self.discard(conn)  # Can't even roll back, so don't hand it out again
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+        self._slots.release()
+
+    def discard(self, conn):
+        close_quietly(conn)
+        self._slots.release()
+
+    def reap(self):
+        limit = time.monotonic() - self.max_idle
+        with self._lock:
+            stale = [conn for conn, used in self._idle if used < limit]
+            self._idle = [(conn, used) for conn, used in self._idle if used >= limit]
+        for conn in stale:
+            close_quietly(conn)
+        return len(stale)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        conn = self.get(timeout)
+        try:
+            yield conn
+        finally:
+            self.put(conn)  # Rolls back anything not committed, error or not
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, used in idle:
+            close_quietly(conn)
+
+def healthy(conn):
+    try:
+        return conn.is_connected()
+    except Exception:
+        return False
+
+def rollback_quietly(conn):
+    try:
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+def close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+# 9. Shared Pool For The Query Paths
+_pool = None
+
+def init_pool(connect, size=5, max_idle=300):
+    global _pool
+    if _pool is not None:
+        _pool.close_all()
+    _pool = ConnectionPool(connect, size, max_idle)
+    return _pool
+
+def get_pool():
+    if _pool is None:
+        raise RuntimeError("Connection pool not initialised, call init_pool() first")
+    return _pool
+
+def create_sqlite_database_and_table(path, pool_size=5, connect_latency=0.0):
+    pool = init_pool(sqlite_connector(path, connect_latency), size=pool_size)
+    execute(CREATE_QUOTES_TABLE)
+    return pool
+
+# 10. Run Queries (Borrow A Connection, Give It Back When Done)
+def execute(sql, params=()):
+    with get_pool().connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        conn.commit()
+        rowcount = cursor.rowcount
+        cursor.close()
+        return rowcount
+
+def fetch_all(sql, params=()):
+    with get_pool().connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+
+# 11. Query Registry (Parsed Once, Reloaded Only When The .sql File's mtime Changes)
+class QueryRegistry(Mapping):
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._mtime = None
+        self._queries = {}
+        self._cursors = weakref.WeakKeyDictionary()  # connection -> {name: prepared cursor}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def refresh(self):
+        mtime = os.stat(self.file_path).st_mtime_ns
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    self._queries = load_queries(self.file_path)
+                    self._cursors = weakref.WeakKeyDictionary()  # Old cursors hold the old SQL
+                    self._mtime = mtime
+                    self.loads += 1
+        return self._queries
+
+    def __getitem__(self, name):
+        return self.refresh()[name]
+
+    def __iter__(self):
+        return iter(self.refresh())
+
+    def __len__(self):
+        return len(self.refresh())
+
+    def cursor(self, conn, name):
+        self.refresh()
+        cursors = self._cursors.setdefault(conn, {})
+        if name not in cursors:
+            cursors[name] = conn.cursor(prepared=True)
+        return cursors[name]
+
+    def execute(self, name, params=()):
+        with get_pool().connection() as conn:
+            cursor = self.cursor(conn, name)
+            cursor.execute(self[name], params)
+            conn.commit()
+            return cursor.rowcount
+
+    def fetch_all(self, name, params=()):
+        with get_pool().connection() as conn:
+            cursor = self.cursor(conn, name)
+            cursor.execute(self[name], params)
+            return cursor.fetchall()
+
+# 12. Batched Writer (Buffer Rows, Flush With executemany In One Transaction Per Batch)
+class BatchWriter:
+    def __init__(self, sql, batch_size=100, flush_interval=1.0):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.sql = sql
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval  # Seconds, None turns the timed flush off
+        self.written = 0
+        self._rows = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_on_timer, daemon=True)
+            self._timer.start()
+
+    def add(self, row):
+        with self._lock:
+            self._rows.append(tuple(row))
+            if len(self._rows) >= self.batch_size:
+                self._flush_locked()
+
+    def add_many(self, rows):
+        for row in rows:
+            self.add(row)
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        while self._rows:
+            batch = self._rows[:self.batch_size]
+            with get_pool().connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(self.sql, batch)
+                conn.commit()
+                cursor.close()
+            del self._rows[:len(batch)]  # Only dropped once the commit went through
+            self.written += len(batch)
+
+    def _flush_on_timer(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass  # Rows stay buffered, the next flush tries again
+
+    def close(self):
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def quote_writer(batch_size=100, flush_interval=1.0):
+    return BatchWriter(initiate_query_runner()["save_quote"], batch_size, flush_interval)
+
+# 13. Streaming Rows (Keyset Pages Of fetchmany Chunks, Memory Stays Flat)
+def check_identifier(name):
+    if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+        raise ValueError(f"Invalid column or table name: {name!r}")
+    return name
+
+def iter_rows(table, columns=None, key="id", chunk_size=1000, page_size=10000, after=None, newest_first=False):
+    check_identifier(table)
+    check_identifier(key)
+    if columns is None:
+        select, key_index, extra_key = f"*, {key}", -1, True
+    else:
+        columns = [check_identifier(column) for column in columns]
+        if key in columns:
+            select, key_index, extra_key = ", ".join(columns), columns.index(key), False
+        else:
+            # The key has to come back too so the next page knows where to start
+            select, key_index, extra_key = ", ".join(columns) + f", {key}", -1, True
+
+    # newest_first walks the key downwards, "after" then means rows below it
+    order, compare = ("DESC", "<") if newest_first else ("", ">")
+    last = after
+    while True:
+        if last is None:
+            sql = f"SELECT {select} FROM {table} ORDER BY {key} {order} LIMIT %s"
+            params = (page_size,)
+        else:
+            sql = f"SELECT {select} FROM {table} WHERE {key} {compare} %s ORDER BY {key} {order} LIMIT %s"
+            params = (last, page_size)
+
+        count = 0
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                count += len(chunk)
+                last = chunk[-1][key_index]
+                for row in chunk:
+                    yield row[:-1] if extra_key else row
+            cursor.close()
+        if count < page_size:
+            return
+
+def iter_saved_quotes(columns=("quotes", "author"), chunk_size=1000, page_size=10000, newest_first=False):
+    return iter_rows("quotes", columns, "id", chunk_size, page_size, newest_first=newest_first)
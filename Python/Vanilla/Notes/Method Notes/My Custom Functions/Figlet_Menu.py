@@ -1,22 +1,107 @@
-from pyfiglet import Figlet
+from functools import lru_cache
+import json
+import os
 import platform
-import subprocess
+import sys
+
+from Lazy_Import import lazy_import
+
+pyfiglet = lazy_import("pyfiglet")  # Not needed at all once the banners are cached on disk
+
+BANNER_CACHE = os.path.join(os.path.expanduser("~"), ".figlet_banners.json")
+
+# 1. Screen Manager (Escape Sequences Instead Of Spawning cls/clear, Redraws Only Changed Lines)
+CLEAR = "\x1b[2J\x1b[H"
+CLEAR_LINE = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+
+class Screen:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.front = []  # Lines currently on the terminal
+        self.back = []  # Next frame, built up before present()
+        if platform.system() == "Windows":
+            os.system("")  # Once per process: makes the Windows console understand escape sequences
+
+    def clear(self):
+        self.stream.write(CLEAR)
+        self.stream.flush()
+        self.front = []
+
+    def draw(self, text):
+        self.back = text.split("\n")
+
+    def present(self):
+        out = []
+        for row, line in enumerate(self.back):
+            if row >= len(self.front) or self.front[row] != line:
+                out.append(f"\x1b[{row + 1};1H{line}{CLEAR_LINE}")
+        # Park the cursor under the frame and wipe whatever was printed there last time
+        out.append(f"\x1b[{len(self.back) + 1};1H{CLEAR_BELOW}")
+        self.stream.write("".join(out))  # One write per frame
+        self.stream.flush()
+        self.front, self.back = self.back, []
+
+    def show(self, text):
+        self.draw(text)
+        self.present()
+
+screen = None
+
+def get_screen():
+    global screen
+    if screen is None:
+        screen = Screen()
+    return screen
 
-# 1. Clear Screen
 def clear_screen():
-    if platform.system() == "Windows":
-        subprocess.run("cls", shell=True)
-    else:
-        subprocess.run("clear", shell=True)
+    get_screen().clear()
+
+# 2. Shared Font Index (Each Font File Is Loaded And Parsed Once)
+@lru_cache(maxsize=None)
+def get_figlet(font="slant", width=80):
+    return pyfiglet.Figlet(font=font, width=width)
+
+def preload_fonts(*fonts, width=80):
+    for font in fonts or ("slant",):
+        get_figlet(font, width)
+
+# 3. Banner Render Cache (In Memory, Backed By A JSON File On Disk)
+_banners = None
+
+def load_banners(path=BANNER_CACHE):
+    global _banners
+    if _banners is None:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                _banners = json.load(file)
+        except (FileNotFoundError, ValueError):
+            _banners = {}
+    return _banners
+
+def save_banners(path=BANNER_CACHE):
+    temp = f"{path}.tmp"
+    try:
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(load_banners(path), file)
+        os.replace(temp, path)  # Never leave a half-written cache behind
+    except OSError:
+        pass  # Read-only home folder, the in-memory cache still works
+
+def render_banner(text, font="slant", width=80, path=BANNER_CACHE):
+    banners = load_banners(path)
+    key = f"{font}|{width}|{text}"
+    if key not in banners:
+        banners[key] = get_figlet(font, width).renderText(text)
+        save_banners(path)
+    return banners[key]
 
-# 2. Menu Set & Menu Print 
+# 4. Menu Set & Menu Print 
 def ascii_title():
-    f = Figlet(font='slant')
-    return f.renderText("InspoQGen")
+    return render_banner("InspoQGen")
 
 def ascii_title2():
-    f = Figlet(font='slant')
-    return f.renderText("Auth-Menu")
+    return render_banner("Auth-Menu")
 
 def menu():
     return f"""
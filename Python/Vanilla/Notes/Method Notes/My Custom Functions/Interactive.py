@@ -1,24 +1,118 @@
-import inquirer
-
-# 1. Interactive Inquirer
-while True:
-        # clear_screen()
-        # print(menu())
-        questions = [
-            inquirer.List(
-                "choice",
-                message="Choose an option",
-                choices=["1. Generate Quote", "2. Show Saved Quote", "3. Exit"]
-            )
-        ]
-
-        answer = inquirer.prompt(questions)
-        if answer["choice"] == "1. Generate Quote":
-            ...
-        elif answer["choice"] == "2. Show Saved Quote":
-            ...
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import closing
+
+import Database
+from API_Request import QuoteFetcher, ResponseCache
+from Animations import AnimationScheduler
+from Figlet_Menu import get_screen, menu
+from Lazy_Import import lazy_import
+
+inquirer = lazy_import("inquirer")
+
+CHOICES = ["1. Generate Quote", "2. Show Saved Quote", "3. Exit"]
+
+# 1. Latency Trace (Input To Response, Per Menu Action)
+class LatencyTrace:
+    def __init__(self):
+        self.samples = {}
+
+    def record(self, action, started):
+        elapsed = (time.perf_counter() - started) * 1000
+        self.samples.setdefault(action, []).append(elapsed)
+        print(f"[trace] {action}: {elapsed:.2f} ms")
+
+    def summary(self):
+        for action, samples in self.samples.items():
+            samples = sorted(samples)
+            print(f"[trace] {action}: {len(samples)}x, p50 {samples[len(samples) // 2]:.2f} ms, max {samples[-1]:.2f} ms")
+
+# 2. Saving Quotes (Only When A Database Pool Is Set Up)
+def open_writer():
+    try:
+        Database.get_pool()
+    except RuntimeError:
+        return None
+    return Database.quote_writer(batch_size=20, flush_interval=1.0)
+
+def connect_database(args):
+    parser = argparse.ArgumentParser(prog="Interactive.py")
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument("--sqlite", metavar="PATH", help="save quotes to a SQLite file")
+    storage.add_argument("--mysql", action="store_true", help="save quotes to a MySQL server (asks for the login)")
+    options = parser.parse_args(args)
+    if options.sqlite:
+        Database.create_sqlite_database_and_table(options.sqlite)
+    elif options.mysql:
+        Database.create_database_and_table(*Database.authentication())
+
+def print_saved_quotes(limit=20):
+    count = 0
+    # Newest first, one page of limit rows; closing() hands the connection back as soon as we stop early
+    with closing(Database.iter_saved_quotes(chunk_size=limit, page_size=limit, newest_first=True)) as rows:
+        for quote, author in rows:
+            count += 1
+            print(f'{count}. "{quote}" - {author}')
+            if count >= limit:
+                break
+    if not count:
+        print("(No saved quotes yet)")
+
+# 3. Interactive Inquirer (asyncio: Slow I/O Runs In The Background, The Prompt Never Waits For It)
+async def main():
+    cache = ResponseCache()  # Keeps Generate Quote working when zenquotes is slow, rate limiting or offline
+    fetcher = QuoteFetcher(cache=cache).start()  # Starts filling the quote buffer before the first prompt
+    writer = open_writer()
+    trace = LatencyTrace()
+    background = set()
+
+    def in_background(fn, *args):
+        task = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        background.add(task)
+        task.add_done_callback(background.discard)
+
+    questions = [inquirer.List("choice", message="Choose an option", choices=CHOICES)]
+    while True:
+        get_screen().show(menu())
+        # The prompt blocks a worker thread, not the loop, so prefetches and writes keep going meanwhile
+        answer = await asyncio.to_thread(inquirer.prompt, questions)
+        started = time.perf_counter()
+        choice = answer["choice"] if answer else CHOICES[2]
+
+        if choice == CHOICES[0]:
+            quote, author = await asyncio.to_thread(fetcher.get_or_fetch)  # Instant when the buffer has one ready
+            print(f'\n"{quote}" - {author}\n')
+            if writer is not None:
+                in_background(writer.add, (quote, author))
+            trace.record("Generate Quote", started)
+        elif choice == CHOICES[1]:
+            if writer is None:
+                print("\nNo database connected.\n")
+            else:
+                await asyncio.to_thread(writer.flush)  # So quotes generated a moment ago show up too
+                await asyncio.to_thread(print_saved_quotes)
+            trace.record("Show Saved Quote", started)
         else:
-            ...
-            # dot_generate("Exiting")
-            # sys.exit(0)
+            break
+        await asyncio.to_thread(input, "Press enter to continue...")
+        if choice == CHOICES[1]:
+            get_screen().clear()  # A long list may have scrolled the menu away, so repaint it fully
+
+    print()
+    scheduler = AnimationScheduler()
+    exiting = scheduler.play(scheduler.dot_generate("Exiting"))
+    await asyncio.gather(*background)
+    await asyncio.to_thread(fetcher.stop)
+    cache.close()
+    if writer is not None:
+        await asyncio.to_thread(writer.close)
+    await exiting
+    print()
+    trace.summary()
+
 
+if __name__ == "__main__":
+    connect_database(sys.argv[1:])  # Without --sqlite or --mysql quotes are shown but not saved
+    asyncio.run(main())
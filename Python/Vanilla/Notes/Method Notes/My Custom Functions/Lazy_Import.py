@@ -0,0 +1,42 @@
+import importlib.util
+import sys
+
+# 1. Lazy Import (Module Object Now, Real Import On First Attribute Access)
+def lazy_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)  # So "import a.b; a.b.x" finds it too, like a real import
+    return module
+
+# 2. Import Time Report (Runs python -X importtime In A Fresh Interpreter)
+def import_times(code, cwd=None):
+    import subprocess  # Kept out of the module imports so loading this file stays cheap
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=cwd,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append((name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+def import_report(code, top=15, cwd=None):
+    times = import_times(code, cwd)
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for name, self_us, cumulative_us in sorted(times, key=lambda each: each[2], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:14.2f} {self_us / 1000:8.2f}  {name}")
+    return times
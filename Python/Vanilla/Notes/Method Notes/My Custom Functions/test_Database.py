@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+
+import pytest
+
+import Database
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = Database.create_sqlite_database_and_table(str(tmp_path / "quotes.db"), pool_size=2)
+    yield pool
+    pool.close_all()
+
+
+def count_quotes():
+    return Database.fetch_all("SELECT COUNT(*) FROM quotes")[0][0]
+
+
+def test_reuses_connections(pool):
+    for _ in range(5):
+        count_quotes()
+    assert pool.created == 1
+
+
+def test_health_check_replaces_broken(pool):
+    count_quotes()
+    pool._idle[0][0].close()  # Dies while sitting idle in the pool
+    assert count_quotes() == 0
+    assert pool.created == 2
+
+
+def test_idle_reaping(tmp_path):
+    pool = Database.init_pool(Database.sqlite_connector(str(tmp_path / "quotes.db")), size=2, max_idle=0.05)
+    with pool.connection():
+        pass
+    assert pool.reap() == 0
+    time.sleep(0.1)
+    assert pool.reap() == 1
+    assert pool._idle == []
+
+
+def test_exhaustion_times_out(pool):
+    first = pool.get()
+    second = pool.get()
+    with pytest.raises(TimeoutError):
+        pool.get(timeout=0.05)
+    pool.put(first)
+    assert pool.get(timeout=0.05) is first
+    pool.put(first)
+    pool.put(second)
+
+
+def test_rollback_on_error(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.cursor().execute("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", ("q", "a"))
+            raise RuntimeError("boom")
+    assert count_quotes() == 0
+    assert len(pool._idle) == 1  # Rolled back and handed out again, not thrown away
+
+
+def test_uncommitted_work_reset_on_return(pool):
+    with pool.connection() as conn:
+        conn.cursor().execute("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", ("q", "a"))
+    assert count_quotes() == 0
+
+
+def test_registry_reloads_on_change(tmp_path, pool):
+    path = tmp_path / "queries.sql"
+    path.write_text("-- name: count\nSELECT COUNT(*) FROM quotes\n")
+    registry = Database.QueryRegistry(str(path))
+    assert registry.fetch_all("count") == [(0,)]
+    assert registry.fetch_all("count") == [(0,)]
+    assert registry.loads == 1
+
+    path.write_text("-- name: count\nSELECT COUNT(*) + 1 FROM quotes\n")
+    later = time.time() + 5
+    os.utime(path, (later, later))
+    assert registry.fetch_all("count") == [(1,)]
+    assert registry.loads == 2
+
+
+def test_batch_writer(pool):
+    writer = Database.BatchWriter("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", batch_size=3, flush_interval=None)
+    writer.add_many([("q1", "a"), ("q2", "a")])
+    assert count_quotes() == 0  # Still buffered
+    writer.add(("q3", "a"))
+    assert count_quotes() == 3  # Full batch flushed
+    writer.add(("q4", "a"))
+    writer.close()
+    assert count_quotes() == 4
+    assert writer.written == 4
+
+
+def test_batch_writer_seen_from_other_connection(pool):
+    # The reader's pooled connection must not keep a snapshot from before the write
+    count_quotes()
+    with Database.BatchWriter("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", flush_interval=None) as writer:
+        holder = pool.get()  # Forces the writer onto the other connection
+        writer.add(("q", "a"))
+        writer.flush()
+        pool.put(holder)
+    assert count_quotes() == 1
+
+
+def test_iter_rows_pages(pool):
+    with Database.BatchWriter("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", flush_interval=None) as writer:
+        writer.add_many((f"q{i}", "a") for i in range(25))
+    rows = list(Database.iter_rows("quotes", ("quotes",), chunk_size=4, page_size=10))
+    assert rows == [(f"q{i}",) for i in range(25)]
+    assert list(Database.iter_rows("quotes", ("id", "quotes"), after=23)) == [(24, "q23"), (25, "q24")]
+    with pytest.raises(ValueError):
+        list(Database.iter_rows("quotes; DROP TABLE quotes"))
+
+
+def test_iter_rows_newest_first(pool):
+    with Database.BatchWriter("INSERT INTO quotes (quotes, author) VALUES (%s, %s)", flush_interval=None) as writer:
+        writer.add_many((f"q{i}", "a") for i in range(25))
+    rows = list(Database.iter_rows("quotes", ("quotes",), chunk_size=4, page_size=10, newest_first=True))
+    assert rows == [(f"q{i}",) for i in reversed(range(25))]
+    assert list(Database.iter_rows("quotes", ("id", "quotes"), after=3, newest_first=True)) == [(2, "q1"), (1, "q0")]
+
+
+def test_threads_share_pool(pool):
+    errors = []
+
+    def work():
+        try:
+            for _ in range(20):
+                count_quotes()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert pool.created <= pool.size